@@ -0,0 +1,71 @@
+# -*- mode: python ; coding: utf-8 -*-
+# GameScout PyInstaller 打包配置
+# 由 build.py 通过 `pyinstaller --noconfirm GameScout.spec` 调用
+
+import os
+import sys
+
+
+def _module_datas(root='modules'):
+    """modules目录的数据文件列表，跳过本地运行产生的__pycache__和.pyc"""
+    datas = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != '__pycache__']
+        datas.extend((os.path.join(dirpath, f), dirpath) for f in filenames if not f.endswith('.pyc'))
+    return datas
+
+
+a = Analysis(
+    ['main.py'],
+    # build.py预装的依赖目录，优先于系统site-packages解析
+    pathex=['.buildenv'] if os.path.isdir('.buildenv') else [],
+    binaries=[],
+    datas=_module_datas(),
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    # 程序运行不需要的标准库模块（tkinter/email/xml为GUI和requests所需，不能排除）
+    excludes=[
+        'unittest',
+        'pydoc',
+        'test',
+        'distutils',
+        'setuptools',
+        'pip',
+        'lib2to3',
+    ],
+    # 保留PYZ归档：onedir下noarchive=True会产生大量零散.pyc文件，冷启动逐个读取反而更慢
+    noarchive=False,
+    # 去除docstring和assert，缩小字节码体积
+    optimize=2,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,  # onedir模式：依赖文件由COLLECT单独输出，启动时无需解压
+    name='GameScout',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=sys.platform != 'win32',  # 非Windows平台去除二进制符号表
+    upx=False,  # 不使用UPX压缩，省去逐个二进制的压缩耗时
+    console=False,  # 无控制台窗口
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=['logo.ico'] if os.path.exists('logo.ico') else None,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=sys.platform != 'win32',
+    upx=False,
+    upx_exclude=[],
+    name='GameScout',
+)
@@ -5,98 +5,620 @@ GameScout 打包脚本
 使用PyInstaller打包成EXE文件
 """
 
-import subprocess
+import argparse
+import atexit
+import hashlib
 import sys
 import os
-import shutil
+import threading
+import time
 
 
-def build_exe():
-    """打包成EXE文件"""
-    print("正在打包成EXE文件...")
-    
-    # PyInstaller命令
-    cmd = [
-        "pyinstaller",
-        "--onefile",  # 打包成单个文件
-        "--windowed",  # 无控制台窗口
-        "--name=GameScout",  # 程序名称
-        "--icon=logo.ico",  # 图标文件（如果有的话）
-        "--add-data=modules;modules",  # 包含modules目录
-        "--hidden-import=selenium",
-        "--hidden-import=webdriver_manager",
-        "--hidden-import=beautifulsoup4",
-        "--hidden-import=requests",
-        "main.py"
-    ]
-    
+# 打包配置文件（已纳入版本管理）
+SPEC_FILE = "GameScout.spec"
+
+# onedir输出目录
+APP_DIR = os.path.join("dist", "GameScout")
+
+# 打包产物缓存，按源码指纹分目录存放（.build-cache/<指纹前12位>/GameScout），切换分支时可直接复用
+CACHE_DIR = ".build-cache"
+CACHE_MAX_ENTRIES = 3
+
+# 记录dist/GameScout当前对应的源码指纹
+DIST_KEY_FILE = os.path.join("dist", "GameScout.key")
+
+# 打包锁文件，防止同一工作目录下多个PyInstaller进程争用build/目录
+LOCK_FILE = "build.lock"
+# 等待其他打包进程释放锁的最长时间（秒），超时后以非零状态退出
+LOCK_TIMEOUT = 30 * 60
+
+# 预装依赖目录，按requirements.txt指纹复用
+BUILDENV_DIR = ".buildenv"
+BUILDENV_STAMP = os.path.join(BUILDENV_DIR, ".requirements.sha256")
+
+# PyInstaller日志中的阶段标记，用于统计各阶段耗时
+PHASE_MARKERS = ("Analysis", "PYZ", "EXE", "COLLECT")
+
+# 依赖清单指纹，依赖变化时才清空build目录
+DEPS_STAMP = os.path.join("build", ".requirements.sha256")
+
+
+def _requirements_hash():
+    """计算requirements.txt的SHA256"""
+    if not os.path.exists("requirements.txt"):
+        return ""
+    with open("requirements.txt", "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _deps_changed():
+    """检查依赖清单是否与上次打包时不同"""
+    if not os.path.exists(DEPS_STAMP):
+        return True
+    with open(DEPS_STAMP, "r", encoding="utf-8") as f:
+        return f.read().strip() != _requirements_hash()
+
+
+def _write_deps_stamp():
+    """记录本次打包使用的依赖清单指纹"""
+    os.makedirs("build", exist_ok=True)
+    with open(DEPS_STAMP, "w", encoding="utf-8") as f:
+        f.write(_requirements_hash())
+
+
+def _scandir_rmtree(path):
+    """
+    基于os.scandir递归删除目录树（scandir自带文件类型信息，无需逐个stat）
+
+    Args:
+        path (str): 目录路径
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _scandir_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _fast_rmtree(*paths):
+    """
+    删除目录或文件，所有路径合并为一次系统命令调用，失败时逐个回退到Python删除
+
+    Args:
+        *paths (str): 目录或文件路径
+    """
+    import subprocess
+
+    if not paths:
+        return
+
+    if os.name == "nt":
+        parts = [f'rd /s /q "{p}"' if os.path.isdir(p) else f'del /f /q "{p}"' for p in paths]
+        cmd = "cmd /c " + " & ".join(parts)
+    else:
+        cmd = ["rm", "-rf", *paths]
+
     try:
-        # 如果没有图标文件，移除图标参数
-        if not os.path.exists("logo.ico"):
-            cmd.remove("--icon=logo.ico")
-            
-        subprocess.check_call(cmd)
-        print("打包完成！")
-        print("EXE文件位置: dist/GameScout.exe")
-        
-        # 复制必要文件到dist目录
-        if os.path.exists("dist"):
-            # 创建data目录
-            data_dir = os.path.join("dist", "data")
-            os.makedirs(data_dir, exist_ok=True)
-            
-            print("打包成功！可以在dist目录找到GameScout.exe")
-            
+        subprocess.run(cmd, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError:
+        pass
+
+    for path in paths:
+        if os.path.isdir(path):
+            _scandir_rmtree(path)
+        elif os.path.exists(path):
+            os.unlink(path)
+
+
+def _installed_versions():
+    """
+    列出打包实际使用的依赖版本：优先读取预装依赖目录，目录不可用时读取当前环境
+
+    Returns:
+        list: 排序后的"名称==版本"字符串列表
+    """
+    from importlib import metadata
+
+    if os.path.isdir(BUILDENV_DIR):
+        dists = metadata.distributions(path=[BUILDENV_DIR])
+    else:
+        dists = metadata.distributions()
+    return sorted(f"{dist.metadata['Name']}=={dist.version}" for dist in dists)
+
+
+def _source_key(cmd):
+    """
+    计算源码指纹：main.py、modules/下的.py文件、spec文件、依赖清单及实际安装的依赖版本、图标、打包命令、
+    PyInstaller版本和Python版本
+
+    Args:
+        cmd (list): PyInstaller命令参数列表，首项为可执行文件路径
+
+    Returns:
+        str: SHA256十六进制摘要
+    """
+    import subprocess
+
+    # logo.ico的有无和内容都会影响打包结果
+    sources = ["main.py", SPEC_FILE, "requirements.txt", "logo.ico"]
+    for root, dirs, files in os.walk("modules"):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        sources.extend(os.path.join(root, name) for name in files if name.endswith(".py"))
+
+    digest = hashlib.sha256()
+    for path in sorted(sources):
+        if not os.path.exists(path):
+            continue
+        digest.update(path.encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(f.read())
+
+    # requirements.txt中的版本未固定，需按实际安装的版本区分
+    digest.update("\n".join(_installed_versions()).encode("utf-8"))
+    digest.update("\0".join(cmd).encode("utf-8"))
+    digest.update(subprocess.check_output([cmd[0], "--version"]).strip())
+    digest.update(sys.version.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _cache_entry(source_key):
+    """
+    获取源码指纹对应的缓存目录
+
+    Args:
+        source_key (str): 源码指纹
+
+    Returns:
+        str: 缓存中的GameScout目录路径
+    """
+    return os.path.join(CACHE_DIR, source_key[:12], "GameScout")
+
+
+def _dist_key():
+    """读取dist/GameScout当前对应的源码指纹"""
+    if not os.path.exists(DIST_KEY_FILE) or not os.path.isdir(APP_DIR):
+        return None
+    with open(DIST_KEY_FILE, "r", encoding="utf-8") as f:
+        return f.read().strip()
+
+
+def _write_dist_key(source_key):
+    """记录dist/GameScout对应的源码指纹"""
+    with open(DIST_KEY_FILE, "w", encoding="utf-8") as f:
+        f.write(source_key)
+
+
+def _restore_from_cache(source_key):
+    """
+    用缓存内容替换dist/GameScout（保留data目录中的用户数据）
+
+    Args:
+        source_key (str): 源码指纹
+    """
+    import shutil
+
+    if os.path.isdir(APP_DIR):
+        stale = [entry.path for entry in os.scandir(APP_DIR) if entry.name != "data"]
+        _fast_rmtree(*stale)
+    shutil.copytree(_cache_entry(source_key), APP_DIR, dirs_exist_ok=True)
+    _write_dist_key(source_key)
+
+
+def _update_cache(source_key):
+    """
+    将本次打包结果（不含data目录）存入缓存，并只保留最近的CACHE_MAX_ENTRIES份
+
+    Args:
+        source_key (str): 源码指纹
+    """
+    import shutil
+
+    entry = _cache_entry(source_key)
+    if os.path.exists(entry):
+        _fast_rmtree(entry)
+    shutil.copytree(APP_DIR, entry, ignore=shutil.ignore_patterns("data"))
+    _write_dist_key(source_key)
+
+    entries = sorted((e for e in os.scandir(CACHE_DIR) if e.is_dir()),
+                     key=lambda e: e.stat().st_mtime, reverse=True)
+    _fast_rmtree(*[e.path for e in entries[CACHE_MAX_ENTRIES:]])
+
+
+def _pid_alive(pid):
+    """
+    检查进程是否仍在运行
+
+    Args:
+        pid (int): 进程ID
+
+    Returns:
+        bool: 进程是否存在
+    """
+    if os.name == "nt":
+        # Windows上os.kill(pid, 0)会发送CTRL_C_EVENT，改用OpenProcess查询
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return kernel32.GetLastError() == 5  # ERROR_ACCESS_DENIED：进程存在但无权访问
+        try:
+            code = ctypes.c_ulong()
+            kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+            return code.value == 259  # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class _BuildLock:
+    """基于O_EXCL创建锁文件的进程间打包锁，持有者进程已退出时自动清除残留的锁文件"""
+
+    def __init__(self, path=LOCK_FILE, poll_interval=1.0, timeout=LOCK_TIMEOUT):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+
+    def _is_stale(self):
+        """锁文件中的PID对应进程已不存在，或PID一直未写入时视为残留的锁"""
+        try:
+            with open(self.path) as f:
+                pid = f.read().strip()
+            if pid.isdigit():
+                return not _pid_alive(int(pid))
+            # 刚创建还未写入PID的锁文件不算残留
+            return time.time() - os.path.getmtime(self.path) > 10
+        except OSError:
+            return False
+
+    def __enter__(self):
+        waiting = False
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if self._is_stale():
+                    print(f"持有打包锁的进程已退出，清除残留的{self.path}")
+                    try:
+                        os.remove(self.path)
+                    except OSError:
+                        pass
+                    continue
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"等待打包锁超过 {self.timeout} 秒（若确认没有其他打包进程，请删除{self.path}）")
+                if not waiting:
+                    print(f"其他打包进程正在运行，等待中...（若确认没有，请删除{self.path}）")
+                    waiting = True
+                time.sleep(self.poll_interval)
+                continue
+            with os.fdopen(fd, "w") as f:
+                f.write(str(os.getpid()))
+            return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+        return False
+
+
+# 后台删除目录的线程，进程退出前等待其完成
+_trash_threads = []
+
+
+def _join_trash_threads():
+    """等待后台删除完成"""
+    for thread in _trash_threads:
+        thread.join()
+
+
+atexit.register(_join_trash_threads)
+
+
+def _discard_dir(*paths):
+    """
+    先将目录重命名为临时名称（单次元数据操作，原目录名立即可用），再在后台线程中一次性删除
+
+    Args:
+        *paths (str): 目录或文件路径
+    """
+    trash_paths = []
+    for path in paths:
+        trash_path = f"{path}.trash-{os.getpid()}"
+        try:
+            os.rename(path, trash_path)
+        except OSError:
+            # 重命名失败时同步删除
+            _fast_rmtree(path)
+            continue
+        trash_paths.append(trash_path)
+
+    if not trash_paths:
+        return
+
+    thread = threading.Thread(target=_fast_rmtree, args=tuple(trash_paths), daemon=False)
+    thread.start()
+    _trash_threads.append(thread)
+
+
+def prepare_venv(force=False):
+    """
+    将requirements.txt中的依赖安装到独立目录，供PyInstaller优先解析
+
+    依赖清单未变化时直接复用已有目录
+
+    Args:
+        force (bool): 是否忽略已有目录重新安装，用于获取依赖的新版本
+
+    Returns:
+        bool: 依赖目录是否可用
+    """
+    import subprocess
+
+    requirements_hash = _requirements_hash()
+    if not force and os.path.exists(BUILDENV_STAMP):
+        with open(BUILDENV_STAMP, "r", encoding="utf-8") as f:
+            if f.read().strip() == requirements_hash:
+                return True
+
+    print("正在准备打包依赖目录...")
+    if os.path.exists(BUILDENV_DIR):
+        _fast_rmtree(BUILDENV_DIR)
+
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "--target", BUILDENV_DIR,
+                               "-r", "requirements.txt"])
     except subprocess.CalledProcessError as e:
-        print(f"打包失败: {e}")
+        print(f"准备依赖目录失败，使用当前环境打包: {e}")
+        if os.path.exists(BUILDENV_DIR):
+            _fast_rmtree(BUILDENV_DIR)
         return False
-        
-    except FileNotFoundError:
+
+    with open(BUILDENV_STAMP, "w", encoding="utf-8") as f:
+        f.write(requirements_hash)
+    return True
+
+
+def _run_streamed(cmd, env=None):
+    """
+    运行命令并逐行输出日志，同时按PyInstaller阶段标记统计耗时
+
+    Args:
+        cmd (list): 命令参数列表
+        env (dict): 子进程环境变量，默认继承当前环境
+
+    Raises:
+        subprocess.CalledProcessError: 命令返回非零退出码
+    """
+    import subprocess
+
+    start = time.perf_counter()
+    phase_starts = {}
+
+    # 子进程统一以UTF-8输出，按UTF-8解码并替换无法解码的字节，避免中文Windows（cp936）下解码失败中断打包
+    env = dict(os.environ if env is None else env, PYTHONIOENCODING="utf-8")
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          encoding="utf-8", errors="replace", bufsize=1, env=env) as proc:
+        for line in proc.stdout:
+            print(line, end="")
+            for marker in PHASE_MARKERS:
+                if marker not in phase_starts and marker in line:
+                    phase_starts[marker] = time.perf_counter()
+
+    end = time.perf_counter()
+
+    # 各阶段耗时 = 下一阶段开始时间 - 本阶段开始时间
+    phases = sorted(phase_starts.items(), key=lambda item: item[1])
+    for i, (marker, phase_start) in enumerate(phases):
+        phase_end = phases[i + 1][1] if i + 1 < len(phases) else end
+        print(f"  {marker}: {phase_end - phase_start:.1f}s")
+    print(f"PyInstaller总耗时: {end - start:.1f}s")
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def _make_zstd_archive():
+    """
+    将onedir输出目录打包为tar并用zstd压缩（比zip/LZMA更快，压缩率相近）
+
+    Returns:
+        str: 压缩包路径，zstd不可用或压缩失败时返回None
+    """
+    import shutil
+    import subprocess
+    import tarfile
+
+    zstd = shutil.which("zstd")
+    if not zstd:
+        print("未找到zstd命令，跳过.tar.zst压缩包生成")
+        return None
+
+    archive = APP_DIR + ".tar.zst"
+    # tar流式写入zstd标准输入，不落地中间tar文件
+    with subprocess.Popen([zstd, "-19", "--long", "-q", "-f", "-o", archive],
+                          stdin=subprocess.PIPE) as proc:
+        with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+            tar.add(APP_DIR, arcname="GameScout")
+        proc.stdin.close()
+
+    if proc.returncode != 0:
+        print(f"zstd压缩失败，退出码: {proc.returncode}")
+        return None
+    return archive
+
+
+def build_exe(make_zip=False, make_zst=False, clean=False):
+    """
+    打包成EXE文件
+
+    Args:
+        make_zip (bool): 是否额外将输出目录打包为zip，便于单文件分发
+        make_zst (bool): 是否额外生成zstd压缩的.tar.zst包
+        clean (bool): 是否强制完整重建（重新安装依赖，不复用打包缓存）
+    """
+    import shutil
+    import subprocess
+
+    print("正在打包成EXE文件...")
+
+    # 预先定位PyInstaller，缺失时直接提示，不必等待进程创建失败
+    pyinstaller = shutil.which("pyinstaller")
+    if not pyinstaller:
         print("PyInstaller未安装，请先运行: pip install pyinstaller")
         return False
+
+    # PyInstaller命令（使用绝对路径），打包选项统一维护在GameScout.spec中
+    cmd = [pyinstaller, "--noconfirm", SPEC_FILE]
+
+    try:
+        with _BuildLock():
+            return _build_locked(cmd, make_zip, make_zst, clean)
+    except (subprocess.CalledProcessError, TimeoutError) as e:
+        print(f"打包失败: {e}")
+        return False
+
+
+def _build_locked(cmd, make_zip, make_zst, clean=False):
+    """
+    持有打包锁时执行的打包流程
+
+    Args:
+        cmd (list): PyInstaller命令参数列表
+        make_zip (bool): 是否额外生成zip包
+        make_zst (bool): 是否额外生成.tar.zst包
+        clean (bool): 是否强制完整重建
+
+    Returns:
+        bool: 是否打包成功
+    """
+    import shutil
+
+    # 依赖从预装目录解析（spec中通过pathex引用）；先准备好目录，源码指纹包含其中实际安装的版本
+    prepare_venv(force=clean)
+
+    source_key = _source_key(cmd)
+    cache_entry = _cache_entry(source_key)
+
+    if clean and os.path.isdir(cache_entry):
+        # 强制重建时丢弃对应的缓存
+        _fast_rmtree(os.path.dirname(cache_entry))
+
+    if os.path.isdir(cache_entry):
+        # 源码未变化，跳过PyInstaller
+        print("源码未变化，复用缓存的打包结果")
+        # 更新缓存的修改时间，淘汰时按最近使用排序
+        os.utime(os.path.dirname(cache_entry))
+        if _dist_key() != source_key:
+            _restore_from_cache(source_key)
+    else:
+        # 依赖变化时缓存失效，清空build目录后完整重建
+        if os.path.exists("build") and _deps_changed():
+            print("依赖清单已变化，清空build目录...")
+            _discard_dir("build")
+
+        # 忽略用户site-packages，依赖只从预装目录和当前环境解析
+        env = dict(os.environ, PYTHONNOUSERSITE="1")
+        _run_streamed(cmd, env=env)
+        _write_deps_stamp()
+        _update_cache(source_key)
+        print("打包完成！")
+    print(f"EXE文件位置: {os.path.join(APP_DIR, 'GameScout.exe')}")
+    
+    # 复制必要文件到输出目录
+    if os.path.isdir(APP_DIR):
+        # 创建data目录（程序运行时在exe所在目录读写数据），已存在时跳过mkdir
+        data_dir = os.path.join(APP_DIR, "data")
+        if not os.path.isdir(data_dir):
+            os.makedirs(data_dir)
+
+        if make_zip:
+            archive = shutil.make_archive(APP_DIR, "zip", "dist", "GameScout")
+            print(f"已生成分发压缩包: {archive}")
+
+        if make_zst:
+            archive = _make_zstd_archive()
+            if archive:
+                print(f"已生成分发压缩包: {archive}（解压: zstd -d -c {os.path.basename(archive)} | tar -x）")
         
+        print(f"打包成功！可以在{APP_DIR}目录找到GameScout.exe")
+
     return True
 
 
-def clean_build():
-    """清理构建文件"""
+def clean_build(full=False):
+    """
+    清理构建文件
+
+    默认保留build目录，供PyInstaller增量打包复用；spec文件已纳入版本管理，不会被删除
+
+    Args:
+        full (bool): 是否完整清理（同时删除build目录）
+    """
     print("清理构建文件...")
-    
-    dirs_to_remove = ["build", "__pycache__"]
-    files_to_remove = ["GameScout.spec"]
-    
-    for dir_name in dirs_to_remove:
-        if os.path.exists(dir_name):
-            shutil.rmtree(dir_name)
-            print(f"已删除: {dir_name}")
-            
-    for file_name in files_to_remove:
-        if os.path.exists(file_name):
-            os.remove(file_name)
-            print(f"已删除: {file_name}")
+
+    dirs_to_remove = ["__pycache__"]
+    files_to_remove = []
+    if full:
+        dirs_to_remove.append("build")
+
+    # 先重命名再由后台线程通过一次系统命令统一删除，不阻塞后续打包
+    targets = [p for p in dirs_to_remove + files_to_remove if os.path.exists(p)]
+    _discard_dir(*targets)
+    for target in targets:
+        print(f"已删除: {target}")
 
 
 def main():
     """主函数"""
+    parser = argparse.ArgumentParser(description="GameScout 打包程序")
+    parser.add_argument("--clean", action="store_true",
+                        help="打包前完整清理build目录，重新安装依赖并忽略打包缓存，强制完整重建（也可设置环境变量GAMESCOUT_CLEAN=1）")
+    parser.add_argument("--no-build", action="store_true",
+                        help="只清理（未指定--clean时仅删除__pycache__），不打包")
+    parser.add_argument("--zip", action="store_true",
+                        help="打包后将dist/GameScout目录压缩为dist/GameScout.zip")
+    parser.add_argument("--zst", action="store_true",
+                        help="打包后将dist/GameScout目录压缩为dist/GameScout.tar.zst（需要zstd命令）")
+    args = parser.parse_args()
+
     print("=" * 50)
     print("GameScout 游戏采集工具 - 打包程序")
     print("=" * 50)
     
-    # 检查main.py是否存在
+    # 检查main.py和spec文件是否存在
     if not os.path.exists("main.py"):
         print("错误: 未找到main.py文件")
         return
-        
-    # 打包
-    if build_exe():
+    if not os.path.exists(SPEC_FILE):
+        print(f"错误: 未找到{SPEC_FILE}文件")
+        return
+
+    clean = args.clean or os.environ.get("GAMESCOUT_CLEAN") == "1"
+    if clean:
+        clean_build(full=True)
+    elif args.no_build:
+        clean_build()
+
+    if args.no_build:
+        return
+
+    # 打包（默认不清理，保留增量缓存）
+    if build_exe(make_zip=args.zip, make_zst=args.zst, clean=clean):
         print("\n打包成功！")
-        
-        # 询问是否清理构建文件
-        response = input("是否清理构建文件？(y/n): ")
-        if response.lower() in ['y', 'yes']:
-            clean_build()
     else:
         print("打包失败！")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -7,22 +7,158 @@ GameScout - 游戏采集工具
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import threading
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
+import re
 import sys
 from datetime import datetime
 import logging
 import atexit
 import signal
+import threading
+import types
+from collections import defaultdict, deque
+from functools import partial
 
 from modules.port_detector import PortDetector
-from modules.game_scraper import GameScraper
-from modules.azgames_scraper import AzGamesScraper
-from modules.armorgames_scraper import ArmorGamesScraper
-from modules.geoguessr_scraper import GeoGuessrScraper
 from modules.data_manager import DataManager
 
+# 版权信息年份，启动时计算一次
+_CURRENT_YEAR = datetime.now().year
+
+# 平台域名对应的显示名称
+_PLATFORM_DISPLAY = {
+    'itch.io': 'Itch',
+    'azgames.io': 'AzGames',
+    'armorgames.com': 'ArmorGames',
+    'geoguessr.io': 'GeoGuessr'
+}
+
+# 平台采集标签页配置：(平台标识, 标签页标题, 数据中的平台名)
+_PLATFORM_TABS = [
+    ('itch', 'Itch', 'itch.io'),
+    ('azgames', 'AzGames', 'azgames.io'),
+    ('armorgames', 'ArmorGames', 'armorgames.com'),
+    ('geoguessr', 'GeoGuessr', 'geoguessr.io')
+]
+
+# 全部平台的数据平台名，未选择平台时默认使用
+_ALL_PLATFORMS = tuple(data_key for key, title, data_key in _PLATFORM_TABS)
+
+# 每个日志文本框保留的最大行数，超出时删除最早的日志
+_MAX_LOG_LINES = 5000
+
+# 数据查看窗口每批插入的行数，首批立即显示，其余在空闲时分批追加
+_TREE_CHUNK_ROWS = 200
+
+# 预览prompts时每个后台任务生成的游戏数量
+_PROMPT_CHUNK_SIZE = 1000
+
+# 去重后游戏数据缓存的最大条目数
+_GAMES_CACHE_SIZE = 16
+
+# itch.zone URL清理用的正则：?v=版本参数、连续重复的/index.html
+_ITCH_V_RE = re.compile(r'\?v=.*$', re.S)
+_ITCH_DUP_RE = re.compile(r'(/index\.html)(?:/index\.html)+')
+
+# 平台域名到平台标识的映射，用于识别手动输入的URL
+_DOMAIN_PLATFORMS = {data_key: key for key, title, data_key in _PLATFORM_TABS}
+
+# 一次匹配URL中的平台域名
+_PLATFORM_RE = re.compile('|'.join(re.escape(domain) for domain in _DOMAIN_PLATFORMS))
+
+# Prompt模板（只读，所有实例共享）
+_PROMPT_TEMPLATES = types.MappingProxyType({
+    "标准版": """学习下demo.php、开发指南.md，然后严格按照demo.php以及开发指南.md，帮我开发下面这个游戏页面（只要创建一个文件，不需要创建变体，不可以有源站的广告）：
+{name_label}： {name}
+FAQ等信息参考：{url}
+<iframe>引入链接：{iframe_embed_url}""",
+
+    "简洁版": """按照demo.php和开发指南.md开发游戏页面（单文件，无广告，需联网调研）：
+游戏名称：{name}
+参考页面：{url}
+游戏链接：{iframe_embed_url}""",
+
+    "详细版": """请学习demo.php、开发指南.md的开发规范，严格按照其中的要求帮我开发下面这个游戏页面：
+
+要求：
+- 只创建一个PHP文件，不需要创建变体
+- 不可以包含源站的广告内容
+- 必须联网调研分析用户需求和游戏特点
+- 严格遵循开发指南中的技术规范
+
+游戏信息：
+{name_label}：{name}
+FAQ等信息参考：{url}
+<iframe>引入链接：{iframe_embed_url}""",
+
+    "专业版": """基于demo.php模板和开发指南.md规范，开发以下游戏页面：
+
+📋 开发要求：
+• 单文件输出，无变体
+• 移除源站广告
+• 联网调研用户需求
+• 遵循技术规范
+
+🎮 游戏详情：
+• 名称：{name}
+• 参考：{url}
+• 嵌入：{iframe_embed_url}""",
+
+    "极简版": """开发游戏页面（参考demo.php和开发指南.md）：
+{name} | {url} | {iframe_embed_url}"""
+})
+
+def _compile_template(template):
+    """
+    将str.format风格的模板预解析为(字面文本, 字段名)片段列表，渲染时只需拼接，不再逐次解析模板
+
+    Args:
+        template (str): prompt模板
+
+    Returns:
+        list: 片段列表；模板包含格式说明、转换符或位置参数时返回None，由调用方回退到str.format
+    """
+    import string
+
+    segments = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is not None and (not field_name.isidentifier() or format_spec or conversion):
+            return None
+        segments.append((literal, field_name))
+    return segments
+
+
+# 已导入的采集器类，按平台标识缓存
+_SCRAPER_CLASSES = {}
+
+
+def _load_scraper_class(platform):
+    """
+    按需导入平台采集器类（采集器会间接导入requests、bs4等较重的依赖，推迟到首次采集时再加载）
+
+    Args:
+        platform (str): 平台标识
+
+    Returns:
+        type: 采集器类
+    """
+    scraper_class = _SCRAPER_CLASSES.get(platform)
+    if scraper_class is None:
+        if platform == 'itch':
+            from modules.game_scraper import GameScraper as scraper_class
+        elif platform == 'azgames':
+            from modules.azgames_scraper import AzGamesScraper as scraper_class
+        elif platform == 'armorgames':
+            from modules.armorgames_scraper import ArmorGamesScraper as scraper_class
+        elif platform == 'geoguessr':
+            from modules.geoguessr_scraper import GeoGuessrScraper as scraper_class
+        else:
+            raise ValueError(f"不支持的平台: {platform}")
+        _SCRAPER_CLASSES[platform] = scraper_class
+    return scraper_class
+
 
 class GameScoutApp:
     def __init__(self, root):
@@ -45,49 +181,96 @@ class GameScoutApp:
 
             icon_path = os.path.join(base_path, "logo.ico")
             if os.path.exists(icon_path):
-                # 尝试多种方法设置图标
-                try:
-                    self.root.iconbitmap(icon_path)
-                except:
-                    # 如果iconbitmap失败，尝试使用PhotoImage
-                    try:
-                        from PIL import Image, ImageTk
-                        img = Image.open(icon_path)
-                        img = img.resize((32, 32), Image.Resampling.LANCZOS)
-                        photo = ImageTk.PhotoImage(img)
-                        self.root.iconphoto(False, photo)
-                        # 保持引用避免被垃圾回收
-                        self.root._icon_photo = photo
-                    except:
-                        # 最后尝试使用wm_iconbitmap
-                        try:
-                            self.root.wm_iconbitmap(icon_path)
-                        except:
-                            pass
+                self._set_window_icon(icon_path)
         except Exception as e:
             print(f"图标加载失败: {e}")  # 调试信息
 
         # 初始化组件
         self.port_detector = PortDetector()
-        self.game_scraper = GameScraper()
-        self.azgames_scraper = None  # 按需创建
+        # 各平台采集器按需创建并长期复用，保留requests会话的连接池
+        self.scrapers = {}
+        # 所有采集器共享的HTTP连接池，首次创建采集器时初始化
+        self._http_adapter = None
+
+        # prompt生成线程池，首次预览时创建，不与采集任务争抢线程
+        self._prompt_executor = None
         self.data_manager = DataManager()
 
         # 设置日志
         self.setup_logging()
 
+        # 界面日志缓冲区和待更新的状态标签，由定时器批量写入控件（采集线程只记录，不直接操作Tk控件）
+        self._log_buffer = deque()
+        self._pending_status = {}
+
+        # 去重后的游戏数据缓存，反复预览/导出时不再重新读取数据文件
+        self._games_cache = {}
+
         # 创建界面
         self.create_widgets()
+        self.root.after(100, self._flush_log_buffer)
 
         # 初始化端口
         self.detect_port()
 
+        # 界面控件在程序运行期间常驻，移入永久代后垃圾回收不再扫描它们
+        # 注意：需要被回收的缓存等对象应在此之后创建
+        import gc
+        gc.freeze()
+
+    # 解码并缩放后的图标图像，多个实例共享，避免重复解码
+    _icon_image = None
+
+    def _set_window_icon(self, icon_path):
+        """
+        设置窗口图标：Windows下.ico直接使用iconbitmap，失败时才导入PIL转换
+
+        Args:
+            icon_path (str): 图标文件路径
+        """
+        if icon_path.lower().endswith('.ico') and sys.platform == 'win32':
+            try:
+                self.root.iconbitmap(icon_path)
+                return
+            except tk.TclError:
+                pass
+
+        try:
+            # 非Windows平台iconbitmap通常不支持.ico，使用PhotoImage
+            from PIL import Image, ImageTk
+            if GameScoutApp._icon_image is None:
+                img = Image.open(icon_path)
+                GameScoutApp._icon_image = img.resize((32, 32), Image.Resampling.LANCZOS)
+            photo = ImageTk.PhotoImage(GameScoutApp._icon_image)
+            self.root.iconphoto(False, photo)
+            # 保持引用避免被垃圾回收
+            self.root._icon_photo = photo
+        except Exception:
+            # 最后尝试使用wm_iconbitmap
+            try:
+                self.root.wm_iconbitmap(icon_path)
+            except tk.TclError:
+                pass
+
     def register_cleanup_handlers(self):
         """注册程序退出时的清理处理器"""
         # 注册atexit清理函数
         atexit.register(self.cleanup_on_exit)
 
         # 注册信号处理器（Windows）
+        # 信号到达时C层会向wakeup socket写入一个字节，由Tk定时器检测后关闭程序，
+        # 避免在Python层信号处理器中执行清理逻辑
+        self._received_signal = None
+        self._signal_rsock = None
+        try:
+            import socket
+            self._signal_rsock, self._signal_wsock = socket.socketpair()
+            self._signal_rsock.setblocking(False)
+            self._signal_wsock.setblocking(False)
+            signal.set_wakeup_fd(self._signal_wsock.fileno())
+        except (OSError, ValueError):
+            self._signal_rsock = None
+
         try:
             signal.signal(signal.SIGTERM, self.signal_handler)
             signal.signal(signal.SIGINT, self.signal_handler)
@@ -95,14 +278,33 @@ class GameScoutApp:
             # 某些信号在Windows上可能不可用
             pass
 
+        if self._signal_rsock:
+            self.root.after(200, self._check_signal_socket)
+
         # 注册窗口关闭事件
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
     def signal_handler(self, signum, frame):
-        """信号处理器"""
-        self.logger.info(f"接收到信号 {signum}，开始清理...")
-        self.cleanup_on_exit()
-        sys.exit(0)
+        """信号处理器，只记录信号编号，清理由_check_signal_socket完成"""
+        self._received_signal = signum
+        if not self._signal_rsock:
+            # wakeup socket不可用时直接清理退出
+            self.cleanup_on_exit()
+            sys.exit(0)
+
+    def _check_signal_socket(self):
+        """定时检查wakeup socket，收到信号时关闭程序"""
+        try:
+            data = self._signal_rsock.recv(64)
+        except (BlockingIOError, InterruptedError):
+            data = b''
+
+        if data:
+            self.logger.info(f"接收到信号 {self._received_signal}，开始清理...")
+            self.on_closing()
+            return
+
+        self.root.after(200, self._check_signal_socket)
 
     def on_closing(self):
         """窗口关闭事件处理"""
@@ -114,14 +316,19 @@ class GameScoutApp:
         """程序退出时的清理函数"""
         try:
             # 停止所有采集活动
-            self.is_scraping = False
+            active_platforms = getattr(self, 'active_platforms', None)
+            if active_platforms:
+                active_platforms.clear()
+            for stop_event in getattr(self, '_stop_events', {}).values():
+                stop_event.set()
 
-            # 清理所有scraper实例
-            scrapers_to_clean = [
-                ('game_scraper', self.game_scraper),
-                ('azgames_scraper', self.azgames_scraper),
-                ('current_scraper', getattr(self, 'current_scraper', None))
-            ]
+            # 取消尚未开始的prompt生成任务；采集线程为守护线程，不会阻塞退出
+            prompt_executor = getattr(self, '_prompt_executor', None)
+            if prompt_executor:
+                prompt_executor.shutdown(wait=False, cancel_futures=True)
+
+            # 清理所有scraper实例（每个采集器只清理一次）
+            scrapers_to_clean = list(getattr(self, 'scrapers', {}).items())
 
             for name, scraper in scrapers_to_clean:
                 if scraper:
@@ -143,26 +350,38 @@ class GameScoutApp:
                     except Exception as e:
                         self.logger.error(f"清理 {name} 时出错: {str(e)}")
 
-            # 强制垃圾回收
-            import gc
-            gc.collect()
+            # 关闭共享的HTTP连接池
+            if getattr(self, '_http_adapter', None):
+                self._http_adapter.close()
+                self._http_adapter = None
 
             self.logger.info("资源清理完成")
 
+            # 停止日志后台线程，输出队列中剩余的日志
+            if getattr(self, '_log_listener', None):
+                self._log_listener.stop()
+                self._log_listener = None
+
         except Exception as e:
             # 清理过程中的错误不应该阻止程序退出
             print(f"清理过程中出错: {str(e)}")
             pass
 
     def setup_logging(self):
-        """设置日志系统"""
+        """设置日志系统（日志记录只入队，格式化和输出由后台线程完成，不阻塞界面线程）"""
+        import queue
+        from logging.handlers import QueueHandler, QueueListener
+
+        log_queue = queue.Queue(-1)
+        console_handler = logging.StreamHandler()  # 只输出到控制台，不创建日志文件
+        console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        self._log_listener = QueueListener(log_queue, console_handler)
+
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler()  # 只输出到控制台，不创建日志文件
-            ]
+            handlers=[QueueHandler(log_queue)]
         )
+        self._log_listener.start()
         self.logger = logging.getLogger(__name__)
 
     def create_widgets(self):
@@ -183,8 +402,7 @@ class GameScoutApp:
         copyright_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
 
         # 获取当前年份
-        import datetime
-        current_year = datetime.datetime.now().year
+        current_year = _CURRENT_YEAR
 
         # 创建版权信息框架
         copyright_text_frame = ttk.Frame(copyright_frame)
@@ -199,8 +417,8 @@ class GameScoutApp:
                               font=('Arial', 8), foreground='blue', cursor='hand2')
         link_label.pack(side=tk.LEFT)
         link_label.bind("<Button-1>", self.open_website)
-        link_label.bind("<Enter>", lambda e: link_label.configure(foreground='darkblue'))
-        link_label.bind("<Leave>", lambda e: link_label.configure(foreground='blue'))
+        link_label.bind("<Enter>", self._hover_on)
+        link_label.bind("<Leave>", self._hover_off)
 
         # 通用设置框架
         settings_frame = ttk.LabelFrame(main_frame, text="通用设置", padding="10")
@@ -210,6 +428,9 @@ class GameScoutApp:
         # 端口设置
         ttk.Label(settings_frame, text="端口设置:").grid(row=0, column=0, sticky=tk.W, pady=5)
         self.port_var = tk.StringVar(value="7897")
+        # 输入变化时解析并缓存，使用时不再读取Tk变量
+        self._recompute_port()
+        self.port_var.trace_add('write', lambda *_: self._recompute_port())
         port_frame = ttk.Frame(settings_frame)
         port_frame.grid(row=0, column=1, sticky=(tk.W, tk.E), pady=5)
 
@@ -219,6 +440,8 @@ class GameScoutApp:
         # 采集数量设置
         ttk.Label(settings_frame, text="采集数量:").grid(row=1, column=0, sticky=tk.W, pady=5)
         self.max_games_var = tk.StringVar(value="0")
+        self._recompute_max_games()
+        self.max_games_var.trace_add('write', lambda *_: self._recompute_max_games())
         games_frame = ttk.Frame(settings_frame)
         games_frame.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=5)
 
@@ -246,17 +469,11 @@ class GameScoutApp:
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
-        # 创建itch.io标签页
-        self.create_itch_tab()
-
-        # 创建azgames.io标签页
-        self.create_azgames_tab()
-
-        # 创建armorgames.com标签页
-        self.create_armorgames_tab()
-
-        # 创建geoguessr.io标签页
-        self.create_geoguessr_tab()
+        # 创建各平台采集标签页
+        self._status_labels = {}
+        self._log_texts = {}
+        for key, title, data_key in _PLATFORM_TABS:
+            self._create_platform_tab(key, title, data_key)
 
         # 创建工具集标签页
         self.create_tools_tab()
@@ -264,175 +481,62 @@ class GameScoutApp:
         # 创建功能标签页
         self.create_function_tab()
 
-        # 初始化变量
-        self.scraping_thread = None
-        self.is_scraping = False
-        self.current_scraper = None
-
-    def create_itch_tab(self):
-        """创建itch.io标签页"""
-        itch_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(itch_frame, text="Itch")
-
-        # 配置网格权重
-        itch_frame.columnconfigure(1, weight=1)
-        itch_frame.rowconfigure(2, weight=1)
-
-        # 采集按钮
-        button_frame = ttk.Frame(itch_frame)
-        button_frame.grid(row=0, column=0, columnspan=2, pady=(0, 10), sticky=tk.W)
-
-        ttk.Button(button_frame, text="开始采集Itch",
-                  command=lambda: self.start_scraping('itch')).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(button_frame, text="停止采集",
-                  command=self.stop_scraping).pack(side=tk.LEFT, padx=5)
-
-        # 状态标签
-        self.itch_status_label = ttk.Label(itch_frame, text="就绪", foreground="green")
-        self.itch_status_label.grid(row=1, column=0, columnspan=2, pady=(0, 10), sticky=tk.W)
-
-        # 日志文本框
-        log_frame = ttk.LabelFrame(itch_frame, text="采集日志", padding="5")
-        log_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
-        log_frame.columnconfigure(0, weight=1)
-        log_frame.rowconfigure(0, weight=1)
-
-        self.itch_log_text = scrolledtext.ScrolledText(log_frame, height=15, width=70)
-        self.itch_log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-
-        # 按钮框架
-        itch_button_frame = ttk.Frame(itch_frame)
-        itch_button_frame.grid(row=3, column=0, columnspan=2, pady=(10, 0), sticky=tk.W)
-
-        ttk.Button(itch_button_frame, text="查看Itch数据",
-                  command=lambda: self.view_data('itch.io')).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(itch_button_frame, text="清空日志",
-                  command=lambda: self.clear_log('itch')).pack(side=tk.LEFT, padx=5)
-
-    def create_azgames_tab(self):
-        """创建azgames.io标签页"""
-        azgames_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(azgames_frame, text="AzGames")
-
-        # 配置网格权重
-        azgames_frame.columnconfigure(1, weight=1)
-        azgames_frame.rowconfigure(2, weight=1)
+        # 初始化变量（各平台独立采集，可同时进行）
+        self.scraping_threads = {}
+        self.active_platforms = set()
+        # 每次采集独立的停止标志，停止操作只影响当前这次采集
+        self._stop_events = {}
+        # 保护scraping_threads的检查与替换，界面线程和采集线程都会访问
+        self._scraping_lock = threading.Lock()
 
-        # 采集按钮
-        button_frame = ttk.Frame(azgames_frame)
-        button_frame.grid(row=0, column=0, columnspan=2, pady=(0, 10), sticky=tk.W)
-
-        ttk.Button(button_frame, text="开始采集AzGames",
-                  command=lambda: self.start_scraping('azgames')).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(button_frame, text="停止采集",
-                  command=self.stop_scraping).pack(side=tk.LEFT, padx=5)
-
-        # 状态标签
-        self.azgames_status_label = ttk.Label(azgames_frame, text="就绪", foreground="green")
-        self.azgames_status_label.grid(row=1, column=0, columnspan=2, pady=(0, 10), sticky=tk.W)
-
-        # 日志文本框
-        log_frame = ttk.LabelFrame(azgames_frame, text="采集日志", padding="5")
-        log_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
-        log_frame.columnconfigure(0, weight=1)
-        log_frame.rowconfigure(0, weight=1)
-
-        self.azgames_log_text = scrolledtext.ScrolledText(log_frame, height=15, width=70)
-        self.azgames_log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-
-        # 按钮框架
-        azgames_button_frame = ttk.Frame(azgames_frame)
-        azgames_button_frame.grid(row=3, column=0, columnspan=2, pady=(10, 0), sticky=tk.W)
-
-        ttk.Button(azgames_button_frame, text="查看AzGames数据",
-                  command=lambda: self.view_data('azgames.io')).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(azgames_button_frame, text="清空日志",
-                  command=lambda: self.clear_log('azgames')).pack(side=tk.LEFT, padx=5)
-
-
-
-    def create_armorgames_tab(self):
-        """创建armorgames.com标签页"""
-        armorgames_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(armorgames_frame, text="ArmorGames")
-
-        # 配置网格权重
-        armorgames_frame.columnconfigure(1, weight=1)
-        armorgames_frame.rowconfigure(2, weight=1)
-
-        # 采集按钮
-        button_frame = ttk.Frame(armorgames_frame)
-        button_frame.grid(row=0, column=0, columnspan=2, pady=(0, 10), sticky=tk.W)
-
-        ttk.Button(button_frame, text="开始采集ArmorGames",
-                  command=lambda: self.start_scraping('armorgames')).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(button_frame, text="停止采集",
-                  command=self.stop_scraping).pack(side=tk.LEFT, padx=5)
-
-        # 状态标签
-        self.armorgames_status_label = ttk.Label(armorgames_frame, text="就绪", foreground="green")
-        self.armorgames_status_label.grid(row=1, column=0, columnspan=2, pady=(0, 10), sticky=tk.W)
-
-        # 日志文本框
-        log_frame = ttk.LabelFrame(armorgames_frame, text="采集日志", padding="5")
-        log_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
-        log_frame.columnconfigure(0, weight=1)
-        log_frame.rowconfigure(0, weight=1)
-
-        self.armorgames_log_text = scrolledtext.ScrolledText(log_frame, height=15, width=70)
-        self.armorgames_log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-
-        # 按钮框架
-        armorgames_button_frame = ttk.Frame(armorgames_frame)
-        armorgames_button_frame.grid(row=3, column=0, columnspan=2, pady=(10, 0), sticky=tk.W)
-
-        ttk.Button(armorgames_button_frame, text="查看ArmorGames数据",
-                  command=lambda: self.view_data('armorgames.com')).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(armorgames_button_frame, text="清空日志",
-                  command=lambda: self.clear_log('armorgames')).pack(side=tk.LEFT, padx=5)
+    def _create_platform_tab(self, key, title, data_key):
+        """
+        创建平台采集标签页
 
-    def create_geoguessr_tab(self):
-        """创建geoguessr.io标签页"""
-        geoguessr_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(geoguessr_frame, text="GeoGuessr")
+        Args:
+            key (str): 平台标识，如'itch'
+            title (str): 标签页标题，如'Itch'
+            data_key (str): 数据中的平台名，如'itch.io'
+        """
+        platform_frame = ttk.Frame(self.notebook, padding="10")
+        self.notebook.add(platform_frame, text=title)
 
         # 配置网格权重
-        geoguessr_frame.columnconfigure(1, weight=1)
-        geoguessr_frame.rowconfigure(2, weight=1)
+        platform_frame.columnconfigure(1, weight=1)
+        platform_frame.rowconfigure(2, weight=1)
 
         # 采集按钮
-        button_frame = ttk.Frame(geoguessr_frame)
+        button_frame = ttk.Frame(platform_frame)
         button_frame.grid(row=0, column=0, columnspan=2, pady=(0, 10), sticky=tk.W)
 
-        ttk.Button(button_frame, text="开始采集GeoGuessr",
-                  command=lambda: self.start_scraping('geoguessr')).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(button_frame, text=f"开始采集{title}",
+                  command=partial(self.start_scraping, key)).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="停止采集",
-                  command=self.stop_scraping).pack(side=tk.LEFT, padx=5)
+                  command=partial(self.stop_scraping, key)).pack(side=tk.LEFT, padx=5)
 
         # 状态标签
-        self.geoguessr_status_label = ttk.Label(geoguessr_frame, text="就绪", foreground="green")
-        self.geoguessr_status_label.grid(row=1, column=0, columnspan=2, pady=(0, 10), sticky=tk.W)
+        status_label = ttk.Label(platform_frame, text="就绪", foreground="green")
+        status_label.grid(row=1, column=0, columnspan=2, pady=(0, 10), sticky=tk.W)
+        self._status_labels[key] = status_label
 
         # 日志文本框
-        log_frame = ttk.LabelFrame(geoguessr_frame, text="采集日志", padding="5")
+        log_frame = ttk.LabelFrame(platform_frame, text="采集日志", padding="5")
         log_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
         log_frame.columnconfigure(0, weight=1)
         log_frame.rowconfigure(0, weight=1)
 
-        self.geoguessr_log_text = scrolledtext.ScrolledText(log_frame, height=15, width=70)
-        self.geoguessr_log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        log_text = scrolledtext.ScrolledText(log_frame, height=15, width=70)
+        log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self._log_texts[key] = log_text
 
         # 按钮框架
-        geoguessr_button_frame = ttk.Frame(geoguessr_frame)
-        geoguessr_button_frame.grid(row=3, column=0, columnspan=2, pady=(10, 0), sticky=tk.W)
-
-        ttk.Button(geoguessr_button_frame, text="查看GeoGuessr数据",
-                  command=lambda: self.view_data('geoguessr.io')).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(geoguessr_button_frame, text="清空日志",
-                  command=lambda: self.clear_log('geoguessr')).pack(side=tk.LEFT, padx=5)
-
-
+        data_button_frame = ttk.Frame(platform_frame)
+        data_button_frame.grid(row=3, column=0, columnspan=2, pady=(10, 0), sticky=tk.W)
 
+        ttk.Button(data_button_frame, text=f"查看{title}数据",
+                  command=partial(self.view_data, data_key)).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(data_button_frame, text="清空日志",
+                  command=partial(self.clear_log, key)).pack(side=tk.LEFT, padx=5)
 
     def create_tools_tab(self):
         """创建工具标签页"""
@@ -465,12 +569,12 @@ class GameScoutApp:
             tool_link = ttk.Label(tool_container, text=tool_name,
                                  font=('Arial', 10, 'bold'), foreground='blue', cursor='hand2')
             tool_link.grid(row=0, column=0, sticky=tk.W)
-            tool_link.bind("<Button-1>", lambda e, url=tool_url: self.open_tool_url(url))
-            tool_link.bind("<Enter>", lambda e, label=tool_link: label.configure(foreground='darkblue'))
-            tool_link.bind("<Leave>", lambda e, label=tool_link: label.configure(foreground='blue'))
+            tool_link.bind("<Button-1>", partial(self.open_tool_url, tool_url))
+            tool_link.bind("<Enter>", self._hover_on)
+            tool_link.bind("<Leave>", self._hover_off)
 
             tool_btn = ttk.Button(tool_container, text="打开工具",
-                                 command=lambda url=tool_url: self.open_tool_url(url))
+                                 command=partial(self.open_tool_url, tool_url))
             tool_btn.grid(row=1, column=0, pady=(3, 0))
 
             ttk.Label(tool_container, text=tool_desc,
@@ -506,12 +610,12 @@ class GameScoutApp:
                 tool_link = ttk.Label(tool_container, text=tool_name,
                                      font=('Arial', 9, 'bold'), foreground='blue', cursor='hand2')
                 tool_link.grid(row=0, column=0, sticky=tk.W)
-                tool_link.bind("<Button-1>", lambda e, url=tool_url: self.open_tool_url(url))
-                tool_link.bind("<Enter>", lambda e, label=tool_link: label.configure(foreground='darkblue'))
-                tool_link.bind("<Leave>", lambda e, label=tool_link: label.configure(foreground='blue'))
+                tool_link.bind("<Button-1>", partial(self.open_tool_url, tool_url))
+                tool_link.bind("<Enter>", self._hover_on)
+                tool_link.bind("<Leave>", self._hover_off)
 
                 tool_btn = ttk.Button(tool_container, text="打开",
-                                     command=lambda url=tool_url: self.open_tool_url(url))
+                                     command=partial(self.open_tool_url, tool_url))
                 tool_btn.grid(row=1, column=0, pady=(2, 0))
             else:  # 暂未提供的工具
                 tool_label = ttk.Label(tool_container, text=tool_name,
@@ -522,8 +626,16 @@ class GameScoutApp:
                                             font=('Arial', 8), foreground='red')
                 unavailable_label.grid(row=1, column=0, pady=(2, 0))
 
-    def open_tool_url(self, url):
-        """打开工具URL"""
+    def _hover_on(self, event):
+        """链接标签鼠标悬停时加深颜色"""
+        event.widget.configure(foreground='darkblue')
+
+    def _hover_off(self, event):
+        """链接标签鼠标移开时恢复颜色"""
+        event.widget.configure(foreground='blue')
+
+    def open_tool_url(self, url, event=None):
+        """打开工具URL（event为标签点击事件绑定时传入，不使用）"""
         try:
             import webbrowser
             webbrowser.open(url)
@@ -573,7 +685,7 @@ class GameScoutApp:
         row = 0
         col = 0
         for platform, var in self.platform_vars.items():
-            platform_display = platform.replace('.io', '').replace('.com', '').title()
+            platform_display = _PLATFORM_DISPLAY[platform]
             ttk.Checkbutton(platform_frame, text=platform_display, variable=var).grid(row=row, column=col, sticky=tk.W, padx=(0, 15), pady=2)
             col += 1
             if col >= 3:  # 每行最多3个
@@ -587,52 +699,13 @@ class GameScoutApp:
         template_frame.grid(row=2, column=1, sticky=tk.W, padx=(10, 0), pady=5)
 
         # 提供多个prompt模板选项
-        prompt_templates = {
-            "标准版": """学习下demo.php、开发指南.md，然后严格按照demo.php以及开发指南.md，帮我开发下面这个游戏页面（只要创建一个文件，不需要创建变体，不可以有源站的广告）：
-{name_label}： {name}
-FAQ等信息参考：{url}
-<iframe>引入链接：{iframe_embed_url}""",
-
-            "简洁版": """按照demo.php和开发指南.md开发游戏页面（单文件，无广告，需联网调研）：
-游戏名称：{name}
-参考页面：{url}
-游戏链接：{iframe_embed_url}""",
-
-            "详细版": """请学习demo.php、开发指南.md的开发规范，严格按照其中的要求帮我开发下面这个游戏页面：
-
-要求：
-- 只创建一个PHP文件，不需要创建变体
-- 不可以包含源站的广告内容
-- 必须联网调研分析用户需求和游戏特点
-- 严格遵循开发指南中的技术规范
-
-游戏信息：
-{name_label}：{name}
-FAQ等信息参考：{url}
-<iframe>引入链接：{iframe_embed_url}""",
-
-            "专业版": """基于demo.php模板和开发指南.md规范，开发以下游戏页面：
-
-📋 开发要求：
-• 单文件输出，无变体
-• 移除源站广告
-• 联网调研用户需求
-• 遵循技术规范
-
-🎮 游戏详情：
-• 名称：{name}
-• 参考：{url}
-• 嵌入：{iframe_embed_url}""",
-
-            "极简版": """开发游戏页面（参考demo.php和开发指南.md）：
-{name} | {url} | {iframe_embed_url}"""
-        }
+        prompt_templates = _PROMPT_TEMPLATES
 
         self.template_var = tk.StringVar(value="标准版")
         template_combo = ttk.Combobox(template_frame, textvariable=self.template_var,
                                      values=list(prompt_templates.keys()), state="readonly", width=15)
         template_combo.pack(side=tk.LEFT)
-        template_combo.bind('<<ComboboxSelected>>', lambda e: self.update_prompt_template(prompt_templates))
+        template_combo.bind('<<ComboboxSelected>>', self.update_prompt_template)
 
         # Prompt内容显示
         ttk.Label(function_frame, text="Prompt内容:", font=('Arial', 10, 'bold')).grid(row=1, column=0, sticky=tk.W, pady=(10, 5))
@@ -653,6 +726,13 @@ FAQ等信息参考：{url}
             'embed_url': tk.StringVar(value='embed链接')
         }
 
+        # 解析后的模板和字段标签缓存，模板内容或字段标签变化时失效
+        self._prompt_settings_cache = None
+        self.prompt_text.edit_modified(False)
+        self.prompt_text.bind('<<Modified>>', self._invalidate_prompt_settings)
+        for var in self.field_labels.values():
+            var.trace_add('write', lambda *_: self._invalidate_prompt_settings())
+
         # 功能按钮
         button_frame = ttk.Frame(function_frame)
         button_frame.grid(row=3, column=0, pady=10)
@@ -660,183 +740,254 @@ FAQ等信息参考：{url}
         ttk.Button(button_frame, text="预览Prompt",
                   command=self.preview_prompts).pack(side=tk.LEFT, padx=10)
         ttk.Button(button_frame, text="导出全量数据",
-                  command=lambda: self.export_prompts(recent_only=False)).pack(side=tk.LEFT, padx=10)
+                  command=partial(self.export_prompts, recent_only=False)).pack(side=tk.LEFT, padx=10)
         ttk.Button(button_frame, text="导出本次新增",
-                  command=lambda: self.export_prompts(recent_only=True)).pack(side=tk.LEFT, padx=10)
+                  command=partial(self.export_prompts, recent_only=True)).pack(side=tk.LEFT, padx=10)
 
-    def update_prompt_template(self, templates):
+    def update_prompt_template(self, event=None):
         """更新prompt模板"""
+        templates = _PROMPT_TEMPLATES
         selected_template = self.template_var.get()
         if selected_template in templates:
             # 更新当前模板内容
             self.current_prompt_template = templates[selected_template]
             # 更新文本框显示
-            self.prompt_text.delete('1.0', tk.END)
-            self.prompt_text.insert('1.0', templates[selected_template])
+            self._replace_text(self.prompt_text, templates[selected_template])
+
+    def _replace_text(self, widget, text):
+        """
+        替换文本框的全部内容，Tk 8.6起使用单次replace调用
+
+        Args:
+            widget: Text或ScrolledText控件
+            text (str): 新内容
+        """
+        if getattr(tk.Text, 'replace', None):
+            widget.replace('1.0', tk.END, text)
+        else:
+            widget.delete('1.0', tk.END)
+            widget.insert('1.0', text)
 
     def log_message(self, message, platform=None):
-        """在日志区域显示消息"""
+        """在日志区域显示消息（先写入缓冲区，由_flush_log_buffer批量显示）"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {message}\n"
-
-        # 根据平台选择对应的日志区域
-        if platform == 'itch':
-            self.itch_log_text.insert(tk.END, log_entry)
-            self.itch_log_text.see(tk.END)
-        elif platform == 'azgames':
-            self.azgames_log_text.insert(tk.END, log_entry)
-            self.azgames_log_text.see(tk.END)
-        elif platform == 'armorgames':
-            self.armorgames_log_text.insert(tk.END, log_entry)
-            self.armorgames_log_text.see(tk.END)
-        elif platform == 'geoguessr':
-            self.geoguessr_log_text.insert(tk.END, log_entry)
-            self.geoguessr_log_text.see(tk.END)
-        else:
-            # 如果没有指定平台，记录到所有日志区域
-            if hasattr(self, 'itch_log_text'):
-                self.itch_log_text.insert(tk.END, log_entry)
-                self.itch_log_text.see(tk.END)
-            if hasattr(self, 'azgames_log_text'):
-                self.azgames_log_text.insert(tk.END, log_entry)
-                self.azgames_log_text.see(tk.END)
-            if hasattr(self, 'armorgames_log_text'):
-                self.armorgames_log_text.insert(tk.END, log_entry)
-                self.armorgames_log_text.see(tk.END)
-            if hasattr(self, 'geoguessr_log_text'):
-                self.geoguessr_log_text.insert(tk.END, log_entry)
-                self.geoguessr_log_text.see(tk.END)
-
-        self.root.update_idletasks()
+        self._log_buffer.append((platform, log_entry))
 
         # 同时记录到日志文件
         self.logger.info(message)
 
-    def detect_port(self):
-        """检测可用端口"""
+    def set_status(self, platform, text, foreground):
+        """
+        更新平台状态标签（可在采集线程中调用，由_flush_log_buffer在界面线程中应用，只保留最新状态）
+
+        Args:
+            platform (str): 平台标识
+            text (str): 状态文本
+            foreground (str): 文字颜色
+        """
+        self._pending_status[platform] = (text, foreground)
+
+    def _flush_log_buffer(self):
+        """每100ms将缓冲的日志按平台合并，每个文本框只插入和滚动一次，并应用最新的状态标签"""
+        log_texts = self._log_texts
+
+        for platform in list(self._pending_status):
+            text, foreground = self._pending_status.pop(platform)
+            self._status_labels[platform].config(text=text, foreground=foreground)
+
+        pending = defaultdict(list)
+        while self._log_buffer:
+            platform, log_entry = self._log_buffer.popleft()
+            # 没有指定平台时记录到所有日志区域
+            targets = [platform] if platform in log_texts else log_texts
+            for target in targets:
+                pending[target].append(log_entry)
+
+        for platform, entries in pending.items():
+            widget = log_texts[platform]
+            widget.insert(tk.END, "".join(entries))
+            self._trim_log(widget)
+            widget.see(tk.END)
+
+        self.root.after(100, self._flush_log_buffer)
+
+    def _recompute_port(self):
+        """解析端口输入并缓存，无效时缓存None"""
         try:
-            port = int(self.port_var.get())
-            if self.port_detector.is_port_available(port):
-                self.log_message(f"端口 {port} 可用")
-            else:
-                available_port = self.port_detector.find_available_port(port)
-                self.port_var.set(str(available_port))
-                self.log_message(f"端口 {port} 不可用，自动切换到端口 {available_port}")
+            self._port_cached = int(self.port_var.get())
         except ValueError:
+            self._port_cached = None
+
+    def _recompute_max_games(self):
+        """解析采集数量输入并缓存，无效时缓存None并标记"""
+        try:
+            max_games = int(self.max_games_var.get())
+            self._max_games_cached = max_games if max_games > 0 else None  # 0表示不限制
+            self._max_games_valid = True
+        except ValueError:
+            self._max_games_cached = None
+            self._max_games_valid = False
+
+    def _trim_log(self, widget, max_lines=_MAX_LOG_LINES):
+        """
+        限制日志文本框行数，避免长时间采集后插入和滚动越来越慢
+
+        Args:
+            widget: 日志文本框
+            max_lines (int): 保留的最大行数
+        """
+        line_count = int(widget.index('end-1c').split('.')[0])
+        if line_count > max_lines:
+            widget.delete('1.0', f'{line_count - max_lines}.0')
+
+    def detect_port(self):
+        """检测可用端口"""
+        port = self._port_cached
+        if port is None:
             messagebox.showerror("错误", "请输入有效的端口号")
+            return
+
+        if self.port_detector.is_port_available(port):
+            self.log_message(f"端口 {port} 可用")
+        else:
+            available_port = self.port_detector.find_available_port(port)
+            self.port_var.set(str(available_port))
+            self.log_message(f"端口 {port} 不可用，自动切换到端口 {available_port}")
 
     def start_scraping(self, platform):
-        """开始采集"""
-        if self.is_scraping:
+        """开始采集（不同平台的采集互不阻塞，可同时运行）"""
+        if platform in self.active_platforms:
+            return
+
+        # 停止后上一次任务要到下次检查停止标志时才结束，结束前不允许重新开始，避免两个任务共用同一个采集器
+        previous = self.scraping_threads.get(platform)
+        if previous is not None and previous.is_alive():
+            self.log_message("上一次采集正在停止，请稍后再试", platform)
             return
 
-        self.is_scraping = True
-        self.current_platform = platform
+        self.active_platforms.add(platform)
 
         # 根据平台设置UI状态
-        if platform == 'itch':
-            self.itch_status_label.config(text="正在采集...", foreground="orange")
-            self.current_scraper = self.game_scraper
-        elif platform == 'azgames':
-            self.azgames_status_label.config(text="正在采集...", foreground="orange")
-            # 创建AzGames采集器实例
-            max_games = self.get_max_games()
-            self.current_scraper = AzGamesScraper(max_games_limit=max_games)
-        elif platform == 'armorgames':
-            self.armorgames_status_label.config(text="正在采集...", foreground="orange")
-            # 创建ArmorGames采集器实例
-            max_games = self.get_max_games()
-            self.current_scraper = ArmorGamesScraper(max_games_limit=max_games)
-        elif platform == 'geoguessr':
-            self.geoguessr_status_label.config(text="正在采集...", foreground="orange")
-            # 创建GeoGuessr采集器实例
-            max_games = self.get_max_games()
-            self.current_scraper = GeoGuessrScraper(max_games_limit=max_games)
-
-
-        # 在新线程中运行采集
-        self.scraping_thread = threading.Thread(target=self.run_scraping, args=(platform,))
-        self.scraping_thread.daemon = True
-        self.scraping_thread.start()
-
-    def stop_scraping(self):
-        """停止采集"""
-        self.is_scraping = False
-        if self.current_scraper:
-            if hasattr(self.current_scraper, 'stop'):
-                self.current_scraper.stop()
-            elif hasattr(self.current_scraper, 'stop_scraping'):
-                self.current_scraper.stop_scraping()
-        self.log_message("正在停止采集...", self.current_platform)
-
-    def get_max_games(self):
-        """获取用户设定的采集数量"""
-        try:
-            max_games = int(self.max_games_var.get())
-            if max_games <= 0:
-                max_games = None  # 0表示不限制
-        except ValueError:
-            max_games = None  # 默认值改为不限制
+        max_games = self.get_max_games(platform)
+        self.set_status(platform, "正在采集...", "orange")
+
+        # 复用上次的采集器实例；上一次任务已结束，此时重置实例上的停止标志不会影响其他任务
+        scraper = self.get_scraper(platform)
+        scraper.should_stop = False
+        stop_event = threading.Event()
+        self._stop_events[platform] = stop_event
+
+        # 在守护线程中运行，各平台的网络等待相互重叠，关闭窗口时不等待采集结束
+        thread = threading.Thread(target=self.run_scraping, args=(platform, max_games, stop_event),
+                                  name=f'gamescout-{platform}', daemon=True)
+        with self._scraping_lock:
+            self.scraping_threads[platform] = thread
+        thread.start()
+
+    def _on_scraping_done(self, platform, thread):
+        """
+        采集任务结束后重置界面状态，只处理仍属于本次任务的状态
+
+        Args:
+            platform (str): 平台标识
+            thread (threading.Thread): 结束的采集线程
+        """
+        with self._scraping_lock:
+            if self.scraping_threads.get(platform) is not thread:
+                return
+            self.scraping_threads.pop(platform)
+            self.active_platforms.discard(platform)
+        # 只写入状态缓冲区，由界面线程应用，窗口已关闭时不会调用Tk
+        self.set_status(platform, "采集完成", "green")
+
+    def get_scraper(self, platform):
+        """
+        获取平台采集器，首次使用时创建，之后复用同一实例
+
+        Args:
+            platform (str): 平台标识
+
+        Returns:
+            采集器实例
+        """
+        scraper = self.scrapers.get(platform)
+        if scraper is None:
+            if self._http_adapter is None:
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                # 与各采集器自建连接池的重试策略一致；429不自动重试，由采集器按Retry-After处理
+                self._http_adapter = HTTPAdapter(
+                    pool_connections=16, pool_maxsize=32,
+                    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+                )
+            scraper = _load_scraper_class(platform)(http_adapter=self._http_adapter, data_manager=self.data_manager)
+            self.scrapers[platform] = scraper
+        return scraper
+
+    def stop_scraping(self, platform):
+        """
+        停止采集
+
+        Args:
+            platform (str): 平台标识
+        """
+        self.active_platforms.discard(platform)
+        stop_event = self._stop_events.get(platform)
+        if stop_event:
+            stop_event.set()
+        scraper = self.scrapers.get(platform)
+        if scraper:
+            if hasattr(scraper, 'stop'):
+                scraper.stop()
+            elif hasattr(scraper, 'stop_scraping'):
+                scraper.stop_scraping()
+        self.log_message("正在停止采集...", platform)
+
+    def get_max_games(self, platform=None):
+        """获取用户设定的采集数量（读取输入变化时缓存的结果）"""
+        if not self._max_games_valid:
+            # 默认值改为不限制
             self.max_games_var.set("0")
-            self.log_message("采集数量设置无效，使用默认值0（不限制）", self.current_platform)
-        return max_games
+            self.log_message("采集数量设置无效，使用默认值0（不限制）", platform)
+        return self._max_games_cached
 
-    def run_scraping(self, platform):
-        """运行采集任务"""
-        try:
-            max_games = self.get_max_games()
+    def run_scraping(self, platform, max_games, stop_event):
+        """
+        运行采集任务
 
+        Args:
+            platform (str): 平台标识
+            max_games (int): 采集数量限制，None表示不限制
+            stop_event (threading.Event): 本次采集的停止标志
+        """
+        scraper = self.scrapers[platform]
+        try:
             # 设置采集器的最大数量
+            scraper.max_games_limit = max_games
             if max_games is not None:
-                self.current_scraper.max_games_limit = max_games
                 self.log_message(f"开始采集 {platform} 游戏数据，限制数量: {max_games}", platform)
             else:
-                self.current_scraper.max_games_limit = None
                 self.log_message(f"开始采集 {platform} 游戏数据，不限制数量", platform)
 
             # 设置回调函数
+            # 进度文本中不变的后缀只拼接一次
+            stats_suffix = f"/{max_games} 个游戏" if max_games is not None else " 个游戏"
+
             def progress_callback(message, count=None):
                 self.log_message(message, platform)
                 if count is not None:
-                    stats_text = f"已采集: {count}"
-                    if max_games is not None:
-                        stats_text += f"/{max_games}"
-                    stats_text += " 个游戏"
-
-                    if platform == 'itch':
-                        self.itch_status_label.config(text=stats_text, foreground="blue")
-                    elif platform == 'azgames':
-                        self.azgames_status_label.config(text=stats_text, foreground="blue")
-                    elif platform == 'armorgames':
-                        self.armorgames_status_label.config(text=stats_text, foreground="blue")
-                    elif platform == 'geoguessr':
-                        self.geoguessr_status_label.config(text=stats_text, foreground="blue")
+                    self.set_status(platform, f"已采集: {count}{stats_suffix}", "blue")
 
             # 开始采集
-            if platform == 'itch':
-                games = self.current_scraper.scrape_games(
-                    progress_callback=progress_callback,
-                    stop_flag=lambda: not self.is_scraping
-                )
-            elif platform == 'azgames':
-                games = self.current_scraper.scrape_games(
-                    progress_callback=progress_callback,
-                    stop_flag=lambda: not self.is_scraping
-                )
-            elif platform == 'armorgames':
-                games = self.current_scraper.scrape_games(
-                    progress_callback=progress_callback,
-                    stop_flag=lambda: not self.is_scraping
-                )
-            elif platform == 'geoguessr':
-                games = self.current_scraper.scrape_games(
-                    progress_callback=progress_callback,
-                    stop_flag=lambda: not self.is_scraping
-                )
-
+            games = scraper.scrape_games(
+                progress_callback=progress_callback,
+                stop_flag=stop_event.is_set
+            )
 
             # 保存数据
             if games:
+                # 保存后数据文件修改时间变化，_games_cache中的旧结果按缓存键自动失效
                 save_result = self.data_manager.save_games(games, platform=platform)
                 total = save_result.get('total', len(games))
                 saved = save_result.get('saved', 0)
@@ -853,17 +1004,7 @@ FAQ等信息参考：{url}
             self.log_message(f"采集过程中发生错误: {str(e)}", platform)
             self.logger.error(f"采集错误: {str(e)}", exc_info=True)
         finally:
-            # 重置界面状态
-            self.is_scraping = False
-            if platform == 'itch':
-                self.itch_status_label.config(text="采集完成", foreground="green")
-            elif platform == 'azgames':
-                self.azgames_status_label.config(text="采集完成", foreground="green")
-            elif platform == 'armorgames':
-                self.armorgames_status_label.config(text="采集完成", foreground="green")
-            elif platform == 'geoguessr':
-                self.geoguessr_status_label.config(text="采集完成", foreground="green")
-
+            self._on_scraping_done(platform, threading.current_thread())
 
     def view_data(self, platform=None):
         """查看采集的数据"""
@@ -892,17 +1033,37 @@ FAQ等信息参考：{url}
         tree.column("embed_url", width=300)
         tree.column("platform", width=100)
 
-        # 添加数据
-        for game in games:
-            tree.insert("", tk.END, values=(
-                game.get("name", ""),
-                game.get("url", ""),
-                game.get("embed_url", "") or game.get("iframe_url", ""),
-                game.get("platform", "")
-            ))
+        # 添加数据：先插入首批再显示控件，其余行在空闲时分批追加，窗口无需等待全部插入完成
+        # 按列分别取值再合并成行，每列是一次独立的推导式循环
+        names = [game.get("name", "") for game in games]
+        urls = [game.get("url", "") for game in games]
+        embed_urls = [game.get("embed_url", "") or game.get("iframe_url", "") for game in games]
+        platforms = [game.get("platform", "") for game in games]
+        rows = list(zip(names, urls, embed_urls, platforms))
+        self._insert_tree_rows(tree, rows, 0)
 
         tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
+    def _insert_tree_rows(self, tree, rows, start):
+        """
+        向树形视图插入一批数据，未插完时在空闲时继续下一批
+
+        Args:
+            tree: 树形视图控件
+            rows (list): 待插入的行数据
+            start (int): 本批起始下标
+        """
+        # 窗口已关闭则停止插入
+        if not tree.winfo_exists():
+            return
+
+        end = start + _TREE_CHUNK_ROWS
+        for values in rows[start:end]:
+            tree.insert("", tk.END, values=values)
+
+        if end < len(rows):
+            self.root.after_idle(self._insert_tree_rows, tree, rows, end)
+
     def export_data(self, platform=None):
         """导出数据"""
         try:
@@ -927,7 +1088,7 @@ FAQ等信息参考：{url}
             main_frame.pack(fill=tk.BOTH, expand=True)
 
             # 平台信息
-            platform_display = platform.replace('.io', '').replace('.com', '').title() if platform else "全部平台"
+            platform_display = _PLATFORM_DISPLAY.get(platform, platform) if platform else "全部平台"
             ttk.Label(main_frame, text=f"导出 {platform_display} 数据",
                      font=('Arial', 12, 'bold')).pack(pady=(0, 20))
 
@@ -985,24 +1146,12 @@ FAQ等信息参考：{url}
 
     def clear_log(self, platform=None):
         """清空日志"""
-        if platform == 'itch':
-            self.itch_log_text.delete(1.0, tk.END)
-        elif platform == 'azgames':
-            self.azgames_log_text.delete(1.0, tk.END)
-        elif platform == 'armorgames':
-            self.armorgames_log_text.delete(1.0, tk.END)
-        elif platform == 'geoguessr':
-            self.geoguessr_log_text.delete(1.0, tk.END)
+        if platform in self._log_texts:
+            self._log_texts[platform].delete(1.0, tk.END)
         else:
             # 清空所有日志
-            if hasattr(self, 'itch_log_text'):
-                self.itch_log_text.delete(1.0, tk.END)
-            if hasattr(self, 'azgames_log_text'):
-                self.azgames_log_text.delete(1.0, tk.END)
-            if hasattr(self, 'armorgames_log_text'):
-                self.armorgames_log_text.delete(1.0, tk.END)
-            if hasattr(self, 'geoguessr_log_text'):
-                self.geoguessr_log_text.delete(1.0, tk.END)
+            for log_text in self._log_texts.values():
+                log_text.delete(1.0, tk.END)
 
     def preview_prompts(self):
         """预览生成的prompts"""
@@ -1021,19 +1170,14 @@ FAQ等信息参考：{url}
                 return
 
             # 获取选中的平台信息
-            selected_platforms = []
-            for platform, var in self.platform_vars.items():
-                if var.get():
-                    platform_display = platform.replace('.io', '').replace('.com', '').title()
-                    selected_platforms.append(platform_display)
-
-            if not selected_platforms:
-                platform_desc = "所有平台"
-            else:
-                platform_desc = ", ".join(selected_platforms)
+            platform_desc = self._selected_platforms_desc()
 
-            # 生成prompts
-            prompts = self.generate_prompts(games)
+            # 模板和字段标签在主线程读取，prompt生成分批交给后台线程，数据量大时界面不卡顿
+            settings = self._prompt_settings()
+            if self._prompt_executor is None:
+                self._prompt_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='gamescout-prompt')
+            futures = deque(self._prompt_executor.submit(self._render_prompts, games[i:i + _PROMPT_CHUNK_SIZE], *settings)
+                            for i in range(0, len(games), _PROMPT_CHUNK_SIZE))
 
             # 创建预览窗口
             preview_window = tk.Toplevel(self.root)
@@ -1044,22 +1188,56 @@ FAQ等信息参考：{url}
             text_area = scrolledtext.ScrolledText(preview_window, wrap=tk.WORD)
             text_area.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-            # 添加头部信息
+            # 头部信息（游戏数量在全部生成后才能确定）
             header = f"# GameScout Prompt预览 - {range_desc}\n"
             header += f"# 选择平台: {platform_desc}\n"
             header += f"# 预览时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-            header += f"# 游戏数量: {len(prompts)}\n\n"
-            header += "=" * 50 + "\n\n"
-            text_area.insert(tk.END, header)
 
-            # 显示prompts
-            for i, prompt in enumerate(prompts, 1):
-                text_area.insert(tk.END, f"{i}. {prompt}\n\n")
+            self._poll_preview(text_area, futures, header, 0)
+
+        except Exception as e:
+            messagebox.showerror("错误", f"预览失败: {str(e)}")
+
+    def _poll_preview(self, text_area, futures, header, count):
+        """
+        按顺序把已生成完成的prompts追加到预览窗口，全部完成后插入头部信息
 
-            text_area.config(state=tk.DISABLED)
+        Args:
+            text_area: 预览文本框
+            futures (deque): 按游戏顺序排列的生成任务
+            header (str): 头部信息
+            count (int): 已插入的prompt数量
+        """
+        # 预览窗口已关闭则取消剩余任务
+        if not text_area.winfo_exists():
+            for future in futures:
+                future.cancel()
+            return
 
+        try:
+            # 本轮已完成的批次拼接后一次性插入
+            parts = []
+            while futures and futures[0].done():
+                for prompt in futures.popleft().result():
+                    count += 1
+                    parts.append(f"{count}. {prompt}\n\n")
         except Exception as e:
+            for future in futures:
+                future.cancel()
             messagebox.showerror("错误", f"预览失败: {str(e)}")
+            return
+
+        if parts:
+            text_area.insert(tk.END, "".join(parts))
+
+        if futures:
+            self.root.after(50, self._poll_preview, text_area, futures, header, count)
+            return
+
+        header += f"# 游戏数量: {count}\n\n"
+        header += "=" * 50 + "\n\n"
+        text_area.insert('1.0', header)
+        text_area.config(state=tk.DISABLED)
 
     def export_prompts(self, recent_only=False):
         """导出prompts到txt文件"""
@@ -1096,127 +1274,190 @@ FAQ等信息参考：{url}
             if not filename:  # 用户取消了保存
                 return
 
-            # 写入文件
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(f"# GameScout Prompt导出 - {type_desc}数据\n")
-                f.write(f"# 导出时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"# 游戏数量: {len(prompts)}\n")
-
-                # 获取选中的平台信息
-                selected_platforms = []
-                for platform, var in self.platform_vars.items():
-                    if var.get():
-                        platform_display = platform.replace('.io', '').replace('.com', '').title()
-                        selected_platforms.append(platform_display)
-
-                if selected_platforms:
-                    f.write(f"# 选择平台: {', '.join(selected_platforms)}\n")
-                else:
-                    f.write(f"# 选择平台: 所有平台\n")
-
-                f.write("\n" + "=" * 50 + "\n\n")
+            # 获取选中的平台信息
+            platform_desc = self._selected_platforms_desc()
+
+            # 先拼接完整内容，再一次性写入文件
+            parts = [
+                f"# GameScout Prompt导出 - {type_desc}数据\n",
+                f"# 导出时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+                f"# 游戏数量: {len(prompts)}\n",
+                f"# 选择平台: {platform_desc}\n",
+                "\n" + "=" * 50 + "\n\n"
+            ]
+            parts.extend(f"{i}. {prompt}\n\n" for i, prompt in enumerate(prompts, 1))
 
-                for i, prompt in enumerate(prompts, 1):
-                    f.write(f"{i}. {prompt}\n\n")
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write("".join(parts))
 
             messagebox.showinfo("成功", f"{type_desc}Prompts已导出到:\n{filename}\n\n共导出 {len(prompts)} 个prompt")
 
         except Exception as e:
             messagebox.showerror("错误", f"导出失败: {str(e)}")
 
-    def get_unique_games(self):
-        """获取选中平台的游戏数据并按name去重"""
-        all_games = []
+    def _selected_platforms(self):
+        """
+        获取用户在Prompt生成页选择的平台
 
-        # 获取用户选择的平台
-        selected_platforms = []
-        for platform, var in self.platform_vars.items():
-            if var.get():  # 如果平台被选中
-                selected_platforms.append(platform)
+        Returns:
+            tuple: 选中平台的数据平台名，未选择时为空元组
+        """
+        return tuple(platform for platform, var in self.platform_vars.items() if var.get())
 
-        # 如果没有选择任何平台，默认加载所有平台
+    def _selected_platforms_desc(self):
+        """
+        获取选中平台的显示名称，用于窗口标题和导出文件头
+
+        Returns:
+            str: 逗号分隔的平台显示名称，未选择时为"所有平台"
+        """
+        selected_platforms = self._selected_platforms()
         if not selected_platforms:
-            selected_platforms = ['itch.io', 'azgames.io', 'armorgames.com', 'geoguessr.io']
+            return "所有平台"
+        return ", ".join(_PLATFORM_DISPLAY[platform] for platform in selected_platforms)
 
-        # 加载选中平台的数据
-        for platform in selected_platforms:
-            platform_games = self.data_manager.load_games(platform=platform)
-            all_games.extend(platform_games)
+    def get_unique_games(self):
+        """获取选中平台的游戏数据并按name去重"""
+        return self._collect_unique_games()
 
-        # 按name去重，保留第一个
-        unique_games = []
-        seen_names = set()
+    def get_recent_unique_games(self):
+        """获取选中平台最近24小时的游戏数据并按name去重"""
+        return self._collect_unique_games(hours=24)
 
-        for game in all_games:
-            name = game.get('name', '').strip()
-            if name and name not in seen_names:
-                seen_names.add(name)
-                unique_games.append(game)
+    def _collect_unique_games(self, hours=None):
+        """
+        分批读取选中平台的游戏数据并按name去重，保留第一个
 
-        return unique_games
+        Args:
+            hours (int): 只读取最近多少小时内的数据，None表示全部
 
-    def get_recent_unique_games(self):
-        """获取选中平台最近24小时的游戏数据并按name去重"""
-        all_games = []
+        Returns:
+            list: 去重后的游戏数据列表
+        """
+        # 获取用户选择的平台，如果没有选择任何平台，默认加载所有平台
+        selected_platforms = self._selected_platforms() or _ALL_PLATFORMS
+
+        # 缓存键包含数据文件的修改时间，新数据落盘后自动失效；
+        # 按时间筛选的结果还要随时间窗口推移失效，按分钟分桶
+        cache_key = (selected_platforms, hours,
+                     self._file_mtime(self.data_manager.db_file),
+                     self._file_mtime(self.data_manager.json_file),
+                     int(datetime.now().timestamp() // 60) if hours else None)
+
+        unique_games = self._games_cache.get(cache_key)
+        if unique_games is None:
+            unique_games = self._dedupe_by_name(self.data_manager.iter_games(selected_platforms, hours=hours))
+            if len(self._games_cache) >= _GAMES_CACHE_SIZE:
+                # 淘汰最早加入的条目
+                self._games_cache.pop(next(iter(self._games_cache)))
+            self._games_cache[cache_key] = unique_games
+
+        return list(unique_games)
+
+    @staticmethod
+    def _file_mtime(path):
+        """获取文件修改时间，文件不存在时返回None"""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
 
-        # 获取用户选择的平台
-        selected_platforms = []
-        for platform, var in self.platform_vars.items():
-            if var.get():  # 如果平台被选中
-                selected_platforms.append(platform)
+    @staticmethod
+    def _dedupe_by_name(batches):
+        """
+        按name去重（忽略首尾空白和大小写），保留第一个有有效链接（iframe_url或embed_url）的游戏
 
-        # 如果没有选择任何平台，默认加载所有平台
-        if not selected_platforms:
-            selected_platforms = ['itch.io', 'azgames.io', 'armorgames.com', 'geoguessr.io']
+        去重键经sys.intern驻留，同名游戏共用一个字符串对象；
+        直接使用精确的set，不引入有误判的概率结构
 
-        # 加载选中平台的最近数据
-        for platform in selected_platforms:
-            platform_games = self.data_manager.get_recent_games(platform=platform, hours=24)
-            all_games.extend(platform_games)
+        Args:
+            batches: 分批的游戏数据，每批为游戏字典列表
 
-        # 按name去重，保留第一个
+        Returns:
+            list: 去重后的游戏数据列表
+        """
         unique_games = []
         seen_names = set()
 
-        for game in all_games:
-            name = game.get('name', '').strip()
-            if name and name not in seen_names:
-                seen_names.add(name)
-                unique_games.append(game)
+        for batch in batches:
+            for game in batch:
+                # 跳过没有有效链接的游戏，后续生成prompt时无需再判断
+                if not ((game.get('iframe_url') or '').strip() or (game.get('embed_url') or '').strip()):
+                    continue
+                name = sys.intern((game.get('name') or '').strip().casefold())
+                if name and name not in seen_names:
+                    seen_names.add(name)
+                    unique_games.append(game)
 
         return unique_games
 
     def generate_prompts(self, games):
         """根据游戏数据生成prompts"""
-        prompts = []
-        template = self.prompt_text.get('1.0', tk.END).strip()
+        return self._render_prompts(games, *self._prompt_settings())
 
-        # 获取字段标签
-        labels = {key: var.get() for key, var in self.field_labels.items()}
+    def _prompt_settings(self):
+        """
+        读取当前的prompt模板和字段标签，需在主线程调用
 
-        for game in games:
-            # 确定使用iframe_url还是embed_url
-            iframe_url = game.get('iframe_url', '').strip()
-            embed_url = game.get('embed_url', '').strip()
+        Returns:
+            tuple: (模板, 字段标签字典, 预解析的模板片段)
+        """
+        if self._prompt_settings_cache is None:
+            template = self.prompt_text.get('1.0', tk.END).strip()
+
+            # 获取字段标签
+            labels = {key: var.get() for key, var in self.field_labels.items()}
+
+            # 模板只解析一次
+            self._prompt_settings_cache = (template, labels, _compile_template(template))
 
+        return self._prompt_settings_cache
+
+    def _invalidate_prompt_settings(self, event=None):
+        """模板内容或字段标签变化时清除缓存"""
+        self._prompt_settings_cache = None
+        # 重置修改标记，下次编辑时才会再次触发<<Modified>>事件
+        self.prompt_text.edit_modified(False)
+
+    def _render_prompts(self, games, template, labels, segments):
+        """
+        用给定的模板和字段标签生成prompts，不访问界面控件，可在后台线程调用
+
+        Args:
+            games (list): 游戏数据列表，需已经过_dedupe_by_name过滤
+            template (str): prompt模板
+            labels (dict): 字段标签
+            segments (list): 预解析的模板片段，为None时使用str.format
+
+        Returns:
+            list: 生成的prompts
+        """
+        prompts = []
+
+        for game in games:
+            # 确定使用iframe_url还是embed_url（去重时已过滤掉两者都为空的游戏）
+            iframe_url = (game.get('iframe_url') or '').strip()
             if iframe_url:
                 iframe_embed_url = self.clean_url_for_display(iframe_url)
                 iframe_embed_label = labels['iframe_url']
-            elif embed_url:
-                iframe_embed_url = self.clean_url_for_display(embed_url)
-                iframe_embed_label = labels['embed_url']
             else:
-                continue  # 跳过没有有效链接的游戏
+                iframe_embed_url = self.clean_url_for_display((game.get('embed_url') or '').strip())
+                iframe_embed_label = labels['embed_url']
 
             # 替换模板中的占位符
-            prompt = template.format(
-                name=game.get('name', ''),
-                name_label=labels['name'],
-                url=game.get('url', ''),
-                url_label=labels['url'],
-                iframe_embed_url=iframe_embed_url,
-                iframe_embed_label=iframe_embed_label
-            )
+            values = {
+                'name': game.get('name', ''),
+                'name_label': labels['name'],
+                'url': game.get('url', ''),
+                'url_label': labels['url'],
+                'iframe_embed_url': iframe_embed_url,
+                'iframe_embed_label': iframe_embed_label
+            }
+            if segments is None:
+                prompt = template.format(**values)
+            else:
+                prompt = "".join([literal + str(values[field]) if field else literal
+                                  for literal, field in segments])
 
             prompts.append(prompt)
 
@@ -1230,18 +1471,8 @@ FAQ等信息参考：{url}
             return
 
         # 检查URL是否属于支持的平台
-        supported_platforms = {
-            'itch.io': 'itch.io',
-            'azgames.io': 'azgames.io',
-            'armorgames.com': 'armorgames.com',
-            'geoguessr.io': 'geoguessr.io'
-        }
-
-        platform = None
-        for domain, platform_name in supported_platforms.items():
-            if domain in url:
-                platform = platform_name
-                break
+        match = _PLATFORM_RE.search(url)
+        platform = match.group(0) if match else None
 
         if not platform:
             messagebox.showerror("错误", "不支持的平台！\n支持的平台：Itch, AzGames, ArmorGames, GeoGuessr")
@@ -1249,37 +1480,17 @@ FAQ等信息参考：{url}
 
         # 显示处理中状态
         self.manual_url_var.set("正在获取iframe地址...")
-        self.root.update()
+        self.root.update_idletasks()  # 只重绘输入框，不处理其他事件
 
         try:
             embed_url = None
             game_name = "手动获取"
 
-            # 根据平台使用相应的采集器获取embed URL
-            if platform == 'itch.io':
-                scraper = self.game_scraper
-                # 对于itch.io，直接调用scrape_game_detail方法
-                game_data = scraper.scrape_game_detail(url, game_name)
-                if game_data:
-                    embed_url = game_data.get('iframe_url') or game_data.get('embed_url')
-            elif platform == 'azgames.io':
-                scraper = AzGamesScraper()
-                # 对于azgames.io，调用scrape_game_detail方法
-                game_data = scraper.scrape_game_detail(url, game_name)
-                if game_data:
-                    embed_url = game_data.get('embed_url')
-            elif platform == 'armorgames.com':
-                scraper = ArmorGamesScraper()
-                # 对于armorgames.com，调用scrape_game_detail方法
-                game_data = scraper.scrape_game_detail(url, game_name)
-                if game_data:
-                    embed_url = game_data.get('embed_url')
-            elif platform == 'geoguessr.io':
-                scraper = GeoGuessrScraper()
-                # 对于geoguessr.io，调用scrape_game_detail方法
-                game_data = scraper.scrape_game_detail(url, game_name)
-                if game_data:
-                    embed_url = game_data.get('embed_url')
+            # 根据平台使用相应的采集器获取embed URL（itch使用iframe_url，其他平台iframe_url为空，使用embed_url）
+            scraper = self.get_scraper(_DOMAIN_PLATFORMS[platform])
+            game_data = scraper.scrape_game_detail(url, game_name)
+            if game_data:
+                embed_url = game_data.get('iframe_url') or game_data.get('embed_url')
 
             # 恢复输入框
             self.manual_url_var.set(url)
@@ -1341,7 +1552,7 @@ FAQ等信息参考：{url}
                           command=result_window.destroy).pack(side=tk.RIGHT)
 
                 # 平台信息
-                platform_display = platform.replace('.io', '').replace('.com', '').title()
+                platform_display = _PLATFORM_DISPLAY[platform]
                 ttk.Label(main_frame, text=f"平台: {platform_display}",
                          foreground="gray").pack(anchor=tk.W, pady=(10, 0))
 
@@ -1358,31 +1569,13 @@ FAQ等信息参考：{url}
         清理URL用于显示，去除重复的/index.html和?v=参数
         与game_scraper.py中的clean_iframe_url逻辑保持一致
         """
-        if not url:
+        # 只处理itch.zone URL，其他URL原样返回
+        if not url or 'itch.zone' not in url:
             return url
 
-        clean_url = url
-
-        # 清理itch.zone URL中的?v=参数和重复的/index.html
-        if 'itch.zone' in clean_url:
-            # 移除?v=参数
-            if '?v=' in clean_url:
-                clean_url = clean_url.split('?v=')[0]
-
-            # 更全面的重复/index.html检测和修复
-            # 1. 检测并修复 /index.html/index.html 结尾的情况
-            if clean_url.endswith('/index.html/index.html'):
-                clean_url = clean_url.replace('/index.html/index.html', '/index.html')
-
-            # 2. 检测并修复中间出现重复的情况，如 /index.html/index.html/
-            elif '/index.html/index.html/' in clean_url:
-                clean_url = clean_url.replace('/index.html/index.html/', '/index.html/')
-
-            # 3. 检测并修复多重重复的情况
-            while '/index.html/index.html' in clean_url:
-                clean_url = clean_url.replace('/index.html/index.html', '/index.html')
-
-        return clean_url
+        # 移除?v=参数，再把连续重复的/index.html合并为一个
+        clean_url = _ITCH_V_RE.sub('', url)
+        return _ITCH_DUP_RE.sub(r'\1', clean_url)
 
     def open_website(self, event):
         """打开prompt2tool.com网站"""
@@ -6,29 +6,92 @@ import time
 import random
 import re
 import logging
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
+import importlib.util
+from contextlib import contextmanager
+from html import unescape
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+
+from .rate_limiter import TokenBucket, AdaptiveConcurrency
+
+# 优先使用C实现的lxml解析器，未安装时回退到标准库解析器
+_HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+# 并发采集游戏详情的线程数
+_DETAIL_WORKERS = 8
+
+# 详情页最多读取的字节数，防止异常的大页面占用过多内存
+_MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# 流式读取详情页的块大小，以及每次扫描时回看的字节数（避免iframe标签被块边界截断而漏匹配）
+_STREAM_CHUNK_SIZE = 16 * 1024
+_STREAM_OVERLAP = 4 * 1024
+
+# 服务器返回429但没有可解析的Retry-After时的暂停秒数
+_DEFAULT_RETRY_AFTER = 5
+
+# 分类页面和其他非游戏页面的URL特征，合并为一个正则一次匹配
+_INVALID_URL_RE = re.compile('|'.join(re.escape(pattern) for pattern in (
+    '/category/',
+    '/tag/',
+    '/search',
+    '/user/',
+    '/about',
+    '/contact',
+    '/privacy',
+    '/terms',
+    '/#',
+    'javascript:',
+    'mailto:',
+    'tel:',
+    '/upload/',
+    '/static/',
+    '/css/',
+    '/js/',
+    '/images/',
+    '/games/date'  # 排除列表页面本身
+)))
+
+# 解析时只构建需要的元素：列表页只要游戏列表，详情页只要iframe
+_LISTING_STRAINER = SoupStrainer('ul', class_='gamelisting')
+_IFRAME_STRAINER = SoupStrainer('iframe')
+
+# 具体的游戏页面（通常是 /game-name/id 格式）
+_GAME_PATH_RE = re.compile(r'/[^/]+-game/\d+')
+
+# 详情页embed URL的单次扫描：iframe#html-game-frame的data-src，或任意指向cache.armorgames.com的data-src
+_EMBED_FUSED_RE = re.compile(
+    r'<iframe[^>]*\bid=["\']html-game-frame["\'][^>]*\bdata-src=["\']([^"\']+)'
+    r'|data-src=["\'](https://[^"\']*\.cache\.armorgames\.com[^"\']*)',
+    re.IGNORECASE
+)
+# 同一模式的bytes版本，用于流式读取时直接扫描原始字节
+_EMBED_FUSED_BYTES_RE = re.compile(_EMBED_FUSED_RE.pattern.encode(), re.IGNORECASE)
+
+# 在整个HTML中搜索embed URL的模式，按优先级排列
+_EMBED_RES = (
+    re.compile(r'data-src=[\'\"](https://[^\'\"]*\.cache\.armorgames\.com[^\'\"]*)[\'\"]*'),
+    re.compile(r'src=[\'\"](https://[^\'\"]*\.cache\.armorgames\.com[^\'\"]*)[\'\"]*'),
+    re.compile(r'(https://\d+\.cache\.armorgames\.com/files/games/[^\'\"\\s]+)'),
+)
 
 
 class ArmorGamesScraper:
-    def __init__(self, max_games_limit=50):
+    def __init__(self, max_games_limit=50, http_adapter=None, data_manager=None):
         """
         初始化ArmorGames采集器
         
         Args:
             max_games_limit (int): 最大采集游戏数量限制
+            http_adapter (HTTPAdapter): 共享的连接池适配器，多个采集器复用同一组连接
+            data_manager (DataManager): 共享的数据管理器，跨平台去重时复用已加载的游戏名称，未传入时首次采集时创建
         """
         self.max_games_limit = max_games_limit
         self.should_stop = False
-        self.driver = None
+        self.data_manager = data_manager
         self.logger = logging.getLogger(__name__)
         
         # 使用固定的User-Agent
@@ -44,33 +107,20 @@ class ArmorGamesScraper:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
-
-    def init_driver(self):
-        """初始化Chrome WebDriver"""
-        try:
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            # 设置固定User-Agent
-            chrome_options.add_argument(f'--user-agent={self.fixed_user_agent}')
-
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-
-            self.logger.info(f"WebDriver 初始化成功，使用固定UA: {self.fixed_user_agent}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"WebDriver 初始化失败: {str(e)}")
-            return False
+        # 未传入共享连接池时自建一个，规格与主程序共享的连接池一致，并对网关错误自动重试
+        # 429不在重试列表中，交给_get按Retry-After暂停限速器并降低并发
+        if not http_adapter:
+            http_adapter = HTTPAdapter(
+                pool_connections=16, pool_maxsize=32,
+                max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+            )
+        self.session.mount('https://', http_adapter)
+        self.session.mount('http://', http_adapter)
+
+        # 所有请求共享的限速器：平均每秒3个请求，最多突发5个
+        self.rate_limiter = TokenBucket(capacity=5, rate=3.0)
+        # 根据响应情况调整同时进行的请求数，上限为详情采集线程数
+        self.concurrency = AdaptiveConcurrency(initial=4, maximum=_DETAIL_WORKERS)
 
     def random_delay(self, min_seconds=2, max_seconds=8):
         """随机延时"""
@@ -80,22 +130,6 @@ class ArmorGamesScraper:
     def stop_scraping(self):
         """停止采集"""
         self.should_stop = True
-        self.cleanup_driver()
-
-    def cleanup_driver(self):
-        """清理WebDriver资源"""
-        if self.driver:
-            try:
-                self.driver.quit()
-                self.logger.info("ArmorGames WebDriver已正常关闭")
-            except Exception as e:
-                self.logger.warning(f"ArmorGames WebDriver关闭时出现异常: {str(e)}")
-            finally:
-                self.driver = None
-
-    def __del__(self):
-        """析构函数，确保资源清理"""
-        self.cleanup_driver()
 
     def scrape_games(self, progress_callback=None, stop_flag=None):
         """
@@ -111,11 +145,15 @@ class ArmorGamesScraper:
         games = []
 
         try:
-            # 第一步：获取所有游戏的基本信息（名称和URL）
+            # 根据用户设置的数量限制，收集够数量的新游戏后即停止处理列表
+            max_games = getattr(self, 'test_limit', None) or self.max_games_limit
+            limit = max_games if max_games and max_games > 0 else None
+
+            # 第一步：获取游戏的基本信息（名称和URL）
             if progress_callback:
                 progress_callback("正在获取ArmorGames游戏列表...")
 
-            game_list = self.get_all_games_list(progress_callback, stop_flag)
+            game_list = self.get_all_games_list(progress_callback, stop_flag, limit=limit)
 
             if not game_list:
                 if progress_callback:
@@ -126,38 +164,47 @@ class ArmorGamesScraper:
                 progress_callback(f"获取到 {len(game_list)} 个游戏，开始逐个采集详情...")
 
             # 第二步：根据用户设置的数量限制，逐个采集游戏详情
-            max_games = getattr(self, 'test_limit', None) or self.max_games_limit
-            if max_games and max_games > 0:
-                game_list = game_list[:max_games]
+            if limit:
+                game_list = game_list[:limit]
                 if progress_callback:
                     progress_callback(f"根据设置限制，将采集前 {len(game_list)} 个游戏")
 
-            # 第三步：逐个采集游戏详情
-            for i, (game_name, game_url) in enumerate(game_list, 1):
-                if stop_flag and stop_flag() or self.should_stop:
-                    break
-
-                if progress_callback:
-                    progress_callback(f"正在采集游戏 {i}/{len(game_list)}: {game_name}")
+            # 第三步：并发采集游戏详情，各请求共用session的连接池
+            total = len(game_list)
+            results = {}
+            with ThreadPoolExecutor(max_workers=_DETAIL_WORKERS, thread_name_prefix='armorgames') as executor:
+                futures = {
+                    executor.submit(self._scrape_detail_task, i, total, game_name, game_url,
+                                    progress_callback, stop_flag): (i, game_name)
+                    for i, (game_name, game_url) in enumerate(game_list, 1)
+                }
 
-                try:
-                    game_data = self.scrape_game_detail(game_url, game_name)
-                    if game_data:
-                        games.append(game_data)
-                        if progress_callback:
-                            progress_callback(f"成功采集游戏: {game_name}", len(games))
-                    else:
+                for future in as_completed(futures):
+                    if stop_flag and stop_flag() or self.should_stop:
+                        # 取消尚未开始的任务，正在进行的请求结束后退出
+                        for pending in futures:
+                            pending.cancel()
+                        break
+
+                    i, game_name = futures[future]
+                    try:
+                        game_data = future.result()
+                        if game_data:
+                            results[i] = game_data
+                            if progress_callback:
+                                progress_callback(f"成功采集游戏: {game_name}", len(results))
+                        else:
+                            if progress_callback:
+                                progress_callback(f"跳过游戏: {game_name} (无有效embed URL)")
+
+                    except Exception as e:
+                        self.logger.error(f"采集游戏详情失败 {game_name}: {str(e)}")
                         if progress_callback:
-                            progress_callback(f"跳过游戏: {game_name} (无有效embed URL)")
-
-                    # 适当延时，避免请求过于频繁
-                    self.random_delay(1, 3)
+                            progress_callback(f"采集失败: {game_name} - {str(e)}")
+                        continue
 
-                except Exception as e:
-                    self.logger.error(f"采集游戏详情失败 {game_name}: {str(e)}")
-                    if progress_callback:
-                        progress_callback(f"采集失败: {game_name} - {str(e)}")
-                    continue
+            # 按游戏列表原有顺序返回
+            games = [results[i] for i in sorted(results)]
 
         except Exception as e:
             self.logger.error(f"采集过程中发生错误: {str(e)}")
@@ -166,13 +213,117 @@ class ArmorGamesScraper:
 
         return games
 
-    def get_all_games_list(self, progress_callback=None, stop_flag=None):
+    def _scrape_detail_task(self, index, total, game_name, game_url, progress_callback=None, stop_flag=None):
+        """
+        线程池任务：采集单个游戏详情
+
+        Args:
+            index (int): 游戏序号
+            total (int): 游戏总数
+            game_name (str): 游戏名称
+            game_url (str): 游戏页面URL
+            progress_callback: 进度回调函数
+            stop_flag: 停止标志函数
+
+        Returns:
+            dict: 游戏数据字典，已停止或无有效embed URL时返回None
+        """
+        if stop_flag and stop_flag() or self.should_stop:
+            return None
+
+        if progress_callback:
+            progress_callback(f"正在采集游戏 {index}/{total}: {game_name}")
+
+        # 请求频率由共享的限速器控制，这里不再固定延时
+        return self.scrape_game_detail(game_url, game_name)
+
+    @contextmanager
+    def _get(self, url, **kwargs):
+        """
+        经限速器和并发控制器发送GET请求，根据响应头和状态码调整请求节奏
+
+        以上下文管理器方式使用，退出时关闭响应；并发名额一直占用到调用方读完响应内容为止，
+        记录的耗时也包含读取内容的时间。
+        服务器返回429时按Retry-After暂停后续请求，X-RateLimit-Remaining耗尽时暂停到X-RateLimit-Reset；
+        429、5xx和网络错误会让并发数减半，正常响应则逐步恢复
+
+        Args:
+            url (str): 请求URL
+            **kwargs: 传给session.get的其他参数
+
+        Yields:
+            requests.Response: 响应对象
+        """
+        with self.concurrency:
+            self.rate_limiter.acquire()
+            start = time.monotonic()
+            try:
+                response = self.session.get(url, **kwargs)
+            except requests.RequestException:
+                self.concurrency.record(time.monotonic() - start, throttled=True)
+                raise
+
+            throttled = response.status_code == 429 or response.status_code >= 500
+
+            delay = self._server_delay(response)
+            if delay:
+                self.logger.warning(f"服务器要求降低请求频率，暂停 {delay:.0f} 秒: {url}")
+                self.rate_limiter.pause(delay)
+
+            try:
+                yield response
+            except requests.HTTPError:
+                # 状态码错误已在上面按状态码判断过
+                raise
+            except requests.RequestException:
+                # 读取响应内容时的网络错误
+                throttled = True
+                raise
+            finally:
+                response.close()
+                self.concurrency.record(time.monotonic() - start, throttled=throttled)
+
+    def _server_delay(self, response):
+        """
+        根据响应头计算服务器要求的暂停时间
+
+        Args:
+            response (requests.Response): 响应对象
+
+        Returns:
+            float: 暂停秒数，无需暂停时返回0
+        """
+        headers = response.headers
+
+        if response.status_code == 429:
+            retry_after = headers.get('Retry-After', '')
+            return float(retry_after) if retry_after.isdigit() else _DEFAULT_RETRY_AFTER
+
+        # 剩余配额耗尽时暂停到配额重置，Reset可能是秒数也可能是Unix时间戳
+        if headers.get('X-RateLimit-Remaining') == '0':
+            reset = headers.get('X-RateLimit-Reset', '')
+            if reset.isdigit():
+                reset = float(reset)
+                return max(0.0, reset - time.time()) if reset > 1e9 else reset
+            return _DEFAULT_RETRY_AFTER
+
+        return 0
+
+    def _get_data_manager(self):
+        """获取数据管理器，未注入时创建一个"""
+        if self.data_manager is None:
+            from .data_manager import DataManager
+            self.data_manager = DataManager()
+        return self.data_manager
+
+    def get_all_games_list(self, progress_callback=None, stop_flag=None, limit=None):
         """
         获取所有游戏的基本信息列表（名称和URL），并过滤已存在的游戏
 
         Args:
             progress_callback: 进度回调函数
             stop_flag: 停止标志函数
+            limit (int): 收集到多少个新游戏后停止，None表示不限制
 
         Returns:
             list: [(game_name, game_url), ...] 游戏信息元组列表（已过滤重复）
@@ -184,20 +335,21 @@ class ArmorGamesScraper:
                 progress_callback("正在获取已存在的游戏列表进行去重...")
 
             # 获取已存在的游戏名称（跨平台去重）
-            from .data_manager import DataManager
-            data_manager = DataManager()
-            existing_games = data_manager.load_games()  # 加载所有平台的游戏
-            existing_names = {data_manager.normalize_game_name(game.get('name', ''))
-                            for game in existing_games}
+            data_manager = self._get_data_manager()
+            normalize = data_manager.normalize_game_name
+            existing_names = data_manager.existing_normalized_names  # 所有平台已有的游戏
+            # 本次采集新收集的游戏名称，避免本次内部重复
+            collected_names = set()
 
             if progress_callback:
                 progress_callback(f"数据库中已有 {len(existing_names)} 个游戏，开始获取ArmorGames游戏列表...")
 
             url = "https://armorgames.com/games/date#games"
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            with self._get(url, timeout=30) as response:
+                response.raise_for_status()
+                content = response.content
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(content, _HTML_PARSER, parse_only=_LISTING_STRAINER)
 
             # 查找游戏列表元素 - 根据要求查找 <ul class="gamelisting"> 中的 li 标签
             game_listing = soup.find('ul', class_='gamelisting')
@@ -237,6 +389,10 @@ class ArmorGamesScraper:
                     if game_url in processed_urls:
                         continue
 
+                    # 先用开销最低的URL检查过滤导航、分类等链接，再提取游戏名称
+                    if not self.is_valid_game_url(game_url):
+                        continue
+
                     # 获取游戏名称 - 从链接的title属性或文本内容获取
                     game_name = link_element.get('title')
                     if not game_name:
@@ -253,22 +409,26 @@ class ArmorGamesScraper:
                     if game_name:
                         game_name = game_name.strip()
 
-                    # 验证游戏信息有效性
-                    if game_name and self.is_valid_game_entry(game_name, game_url):
+                    # 验证游戏名称有效性（URL已在上面验证）
+                    if game_name and len(game_name) >= 2:
                         # 检查是否已存在（跨平台去重）
-                        normalized_name = data_manager.normalize_game_name(game_name)
-                        if normalized_name in existing_names:
+                        normalized_name = normalize(game_name)
+                        if normalized_name in existing_names or normalized_name in collected_names:
                             skipped_count += 1
                             self.logger.debug(f"跳过已存在游戏: {game_name}")
                             continue
 
                         game_list.append((game_name, game_url))
                         processed_urls.add(game_url)
-                        existing_names.add(normalized_name)  # 添加到已存在列表，避免本次内部重复
+                        collected_names.add(normalized_name)
 
                         if progress_callback and len(game_list) % 10 == 0:
                             progress_callback(f"已收集 {len(game_list)} 个新游戏，跳过 {skipped_count} 个重复...")
 
+                        # 已够采集数量，剩余条目无需再处理
+                        if limit and len(game_list) >= limit:
+                            break
+
                 except Exception as e:
                     self.logger.error(f"处理游戏项目时出错: {str(e)}")
                     continue
@@ -298,42 +458,32 @@ class ArmorGamesScraper:
         if not game_name or len(game_name) < 2:
             return False
 
+        return self.is_valid_game_url(game_url)
+
+    def is_valid_game_url(self, game_url):
+        """
+        验证URL是否指向具体的游戏页面，开销低，可在提取游戏名称之前调用
+
+        Args:
+            game_url (str): 游戏URL
+
+        Returns:
+            bool: 是否为游戏页面URL
+        """
         # 检查URL是否指向真正的游戏页面
         if not game_url or 'armorgames.com' not in game_url:
             return False
 
-        # 过滤掉分类页面和其他非游戏页面
-        invalid_patterns = [
-            '/category/',
-            '/tag/',
-            '/search',
-            '/user/',
-            '/about',
-            '/contact',
-            '/privacy',
-            '/terms',
-            '/#',
-            'javascript:',
-            'mailto:',
-            'tel:',
-            '/upload/',
-            '/static/',
-            '/css/',
-            '/js/',
-            '/images/',
-            '/games/date'  # 排除列表页面本身
-        ]
-
-        for pattern in invalid_patterns:
-            if pattern in game_url.lower():
-                self.logger.debug(f"过滤掉非游戏链接: {game_url}")
-                return False
-
-        # 确保是具体的游戏页面（通常是 /game-name/id 格式）
-        if not re.search(r'/[^/]+-game/\d+', game_url):
+        # 确保是具体的游戏页面（通常是 /game-name/id 格式），列表中的导航链接大多在这一步被过滤
+        if not _GAME_PATH_RE.search(game_url):
             self.logger.debug(f"过滤掉非游戏页面: {game_url}")
             return False
 
+        # 过滤掉分类页面和其他非游戏页面
+        if _INVALID_URL_RE.search(game_url.lower()):
+            self.logger.debug(f"过滤掉非游戏链接: {game_url}")
+            return False
+
         return True
 
     def scrape_game_detail(self, game_url, game_name):
@@ -350,14 +500,15 @@ class ArmorGamesScraper:
         try:
             self.logger.info(f"正在处理游戏: {game_name} - {game_url}")
 
-            # 使用requests获取游戏详情页面
-            response = self.session.get(game_url, timeout=30)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # 使用requests流式获取游戏详情页面，找到embed URL后立即停止读取
+            with self._get(game_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                embed_url, raw = self._stream_embed_url(response)
 
-            # 提取embed URL
-            embed_url = self.extract_embed_url(soup, game_url, response.text)
+            # 读完页面仍未找到时，解码一次后用完整的提取逻辑
+            if not embed_url:
+                html = raw.decode(response.encoding or 'utf-8', errors='replace')
+                embed_url = self.extract_embed_url(game_url, html)
 
             # 只有当embed_url有效时才返回数据
             if embed_url and embed_url.strip():
@@ -379,14 +530,43 @@ class ArmorGamesScraper:
             self.logger.error(f"采集游戏详情失败 {game_url}: {str(e)}")
             return None
 
-    def extract_embed_url(self, soup, game_url, html_content=None):
+    def _stream_embed_url(self, response):
+        """
+        分块读取响应内容，边读边扫描embed URL，匹配后不再读取剩余内容
+
+        Args:
+            response (requests.Response): 以stream=True发出的请求的响应
+
+        Returns:
+            tuple: (embed URL或None, 未找到时已读取的页面字节)
+        """
+        buffer = bytearray()
+        for chunk in response.iter_content(_STREAM_CHUNK_SIZE):
+            # 只扫描新读到的内容，加上回看部分
+            start = max(0, len(buffer) - _STREAM_OVERLAP)
+            buffer += chunk
+
+            match = _EMBED_FUSED_BYTES_RE.search(buffer, start)
+            if match:
+                url = (match.group(1) or match.group(2)).decode(response.encoding or 'utf-8', errors='replace')
+                clean_url = self.clean_embed_url(unescape(url))
+                self.logger.info(f"通过HTML扫描找到URL: {clean_url}")
+                return clean_url, b''
+
+            if len(buffer) >= _MAX_PAGE_BYTES:
+                break
+
+        return None, bytes(buffer)
+
+    def extract_embed_url(self, game_url, html_content):
         """
         从游戏详情页面提取embed URL
         根据要求，查找 <iframe id="html-game-frame"> 中的 data-src 属性
         并去掉 ?v= 参数
 
+        先用一个正则扫描原始HTML，未命中时才解析iframe元素
+
         Args:
-            soup: BeautifulSoup对象
             game_url (str): 游戏页面URL
             html_content (str): 原始HTML内容
 
@@ -394,6 +574,18 @@ class ArmorGamesScraper:
             str: embed URL
         """
         try:
+            if not html_content:
+                return None
+
+            # 单次正则扫描，大多数页面在这里就能找到，无需构建解析树
+            match = _EMBED_FUSED_RE.search(html_content)
+            if match:
+                clean_url = self.clean_embed_url(unescape(match.group(1) or match.group(2)))
+                self.logger.info(f"通过HTML扫描找到URL: {clean_url}")
+                return clean_url
+
+            soup = BeautifulSoup(html_content, _HTML_PARSER, parse_only=_IFRAME_STRAINER)
+
             # 方法1: 查找指定的iframe元素
             iframe = soup.find('iframe', id='html-game-frame')
             if iframe:
@@ -414,20 +606,13 @@ class ArmorGamesScraper:
                     return clean_url
 
             # 方法3: 在整个HTML中搜索包含cache.armorgames.com的URL
-            if html_content:
-                # 搜索所有可能的embed URL模式
-                embed_patterns = [
-                    r'data-src=[\'\"](https://[^\'\"]*\.cache\.armorgames\.com[^\'\"]*)[\'\"]*',
-                    r'src=[\'\"](https://[^\'\"]*\.cache\.armorgames\.com[^\'\"]*)[\'\"]*',
-                    r'(https://\d+\.cache\.armorgames\.com/files/games/[^\'\"\\s]+)',
-                ]
-
-                for pattern in embed_patterns:
-                    matches = re.findall(pattern, html_content)
-                    if matches:
-                        clean_url = self.clean_embed_url(matches[0])
-                        self.logger.info(f"通过HTML搜索找到URL: {clean_url}")
-                        return clean_url
+            # 搜索所有可能的embed URL模式，取第一个匹配
+            for pattern in _EMBED_RES:
+                match = pattern.search(html_content)
+                if match:
+                    clean_url = self.clean_embed_url(match.group(1))
+                    self.logger.info(f"通过HTML搜索找到URL: {clean_url}")
+                    return clean_url
 
             return None
 
@@ -445,11 +630,5 @@ class ArmorGamesScraper:
         Returns:
             str: 清理后的URL
         """
-        if not url:
-            return url
-
-        # 去掉 ?v= 参数
-        if '?v=' in url:
-            url = url.split('?v=')[0]
-
-        return url
+        # 去掉 ?v= 参数，partition只扫描一次且不创建列表
+        return url.partition('?v=')[0] if url else url
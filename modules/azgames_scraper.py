@@ -2,33 +2,97 @@
 AzGames.io 游戏采集器
 """
 
+import os
 import time
 import random
+import hashlib
 import re
 import logging
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
+import importlib.util
+import atexit
+import threading
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from .rate_limiter import TokenBucket
+
+# 优先使用C实现的lxml解析器，未安装时回退到标准库解析器
+_HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+# 列表页只构建游戏网格部分，其余内容不生成节点
+_GRID_STRAINER = SoupStrainer(class_='us-grid-game')
+
+# 并发采集游戏详情的线程数
+_DETAIL_WORKERS = 8
+# 详情页最多读取的字节数，超过后不再继续下载
+_MAX_PAGE_BYTES = 512 * 1024
+# 流式读取详情页的分块大小，以及跨块匹配时回看的字节数
+_STREAM_CHUNK_SIZE = 16 * 1024
+_STREAM_OVERLAP = 4 * 1024
+# 详情页解析结果的本地缓存有效期（秒），有效期内重复采集直接读取缓存，不再请求网络
+_CACHE_TTL = 24 * 60 * 60
+# 清理过期缓存的最小间隔（秒）
+_CACHE_PRUNE_INTERVAL = 60 * 60
+
+# 分类页面和其他非游戏页面的URL特征，合并为一个正则一次匹配
+_INVALID_URL_RE = re.compile('|'.join(re.escape(pattern) for pattern in (
+    '/category/',
+    '/tag/',
+    '/search',
+    '/user/',
+    '/about',
+    '/contact',
+    '/privacy',
+    '/terms',
+    '/#',
+    'javascript:',
+    'mailto:',
+    'tel:',
+    '/upload/',
+    '/static/',
+    '/css/',
+    '/js/',
+    '/images/'
+)))
+
+# 完整的embed URL，如 https://azgames.io/subway-moto.embed
+_EMBED_ABS_RE = re.compile(r'https://azgames\.io/[^<>\s"\']+\.embed')
+# 同一模式的bytes版本，用于流式读取时直接扫描原始字节
+_EMBED_ABS_BYTES_RE = re.compile(_EMBED_ABS_RE.pattern.encode())
+# 包含embed链接的HTML注释
+_EMBED_COMMENT_RE = re.compile(r'<!--.*?az-games__embed-link.*?-->', re.DOTALL)
+# JavaScript字符串中的.embed地址
+_EMBED_JS_RE = re.compile(r'["\']([^"\']*\.embed)["\']')
+# 在整个HTML内容中搜索.embed URL的模式，按优先级排列
+_EMBED_HTML_RES = (
+    _EMBED_ABS_RE,
+    re.compile(r'/[^<>\s"\']+\.embed'),
+    re.compile(r'"([^"]*\.embed)"'),
+    re.compile(r"'([^']*\.embed)'"),
+)
 
 
 class AzGamesScraper:
-    def __init__(self, max_games_limit=50):
+    # 所有实例共享的WebDriver，首次需要浏览器时创建，进程退出时关闭
+    _driver_singleton = None
+    _driver_lock = threading.Lock()
+
+    def __init__(self, max_games_limit=50, http_adapter=None, data_manager=None):
         """
         初始化AzGames采集器
         
         Args:
             max_games_limit (int): 最大采集游戏数量限制
+            http_adapter (HTTPAdapter): 共享的连接池适配器，多个采集器复用同一组连接
+            data_manager (DataManager): 共享的数据管理器，跨平台去重时复用已加载的游戏名称，未传入时首次采集时创建
         """
         self.max_games_limit = max_games_limit
         self.should_stop = False
         self.driver = None
+        self.data_manager = data_manager
         self.logger = logging.getLogger(__name__)
         
         # 使用固定的搜索引擎User-Agent，避免频繁变化
@@ -44,10 +108,37 @@ class AzGamesScraper:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
+        # 未传入共享连接池时自建一个，保持长连接复用，并对服务器错误自动重试
+        if not http_adapter:
+            http_adapter = HTTPAdapter(
+                pool_connections=32, pool_maxsize=32,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+            )
+        self.session.mount('https://', http_adapter)
+        self.session.mount('http://', http_adapter)
+
+        # 所有详情线程共享的限速器：原先每个线程请求后平均等待2秒，折算为整体每秒_DETAIL_WORKERS/2个请求
+        self.rate_limiter = TokenBucket(capacity=_DETAIL_WORKERS, rate=_DETAIL_WORKERS / 2.0)
+        # 上次清理过期缓存的时间
+        self._cache_pruned_at = 0.0
 
     def init_driver(self):
-        """初始化Chrome WebDriver"""
+        """初始化Chrome WebDriver，已有存活的共享实例时直接复用"""
+        with AzGamesScraper._driver_lock:
+            if self._driver_alive(AzGamesScraper._driver_singleton):
+                self.driver = AzGamesScraper._driver_singleton
+                return True
+            return self._create_driver()
+
+    def _create_driver(self):
+        """创建Chrome WebDriver并保存为共享实例，调用方需持有_driver_lock"""
         try:
+            # Selenium依赖较重，仅在需要浏览器时导入
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            from selenium.webdriver.chrome.service import Service
+            from webdriver_manager.chrome import ChromeDriverManager
+
             chrome_options = Options()
             chrome_options.add_argument('--headless')
             chrome_options.add_argument('--no-sandbox')
@@ -57,13 +148,24 @@ class AzGamesScraper:
             chrome_options.add_argument('--disable-blink-features=AutomationControlled')
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
+            # 只需要读取游戏链接，不加载图片、不弹通知
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.default_content_setting_values.notifications': 2,
+            })
             
             # 设置固定User-Agent
             chrome_options.add_argument(f'--user-agent={self.fixed_user_agent}')
 
             service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            # 通过CDP屏蔽图片、样式和字体请求，翻页时只下载需要的HTML和脚本
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': [
+                '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.css', '*.woff', '*.woff2'
+            ]})
+            AzGamesScraper._driver_singleton = self.driver = driver
 
             self.logger.info(f"WebDriver 初始化成功，使用固定UA: {self.fixed_user_agent}")
             return True
@@ -72,6 +174,36 @@ class AzGamesScraper:
             self.logger.error(f"WebDriver 初始化失败: {str(e)}")
             return False
 
+    @staticmethod
+    def _driver_alive(driver):
+        """
+        检查WebDriver对应的chromedriver进程是否仍在运行
+
+        Args:
+            driver: WebDriver实例
+
+        Returns:
+            bool: 是否可以继续使用
+        """
+        if driver is None:
+            return False
+        try:
+            return driver.service.process.poll() is None
+        except Exception:
+            return False
+
+    @classmethod
+    def _quit_driver(cls):
+        """关闭共享的WebDriver（进程退出时调用）"""
+        with cls._driver_lock:
+            driver, cls._driver_singleton = cls._driver_singleton, None
+        if driver:
+            try:
+                driver.quit()
+                logging.getLogger(__name__).info("AzGames WebDriver已正常关闭")
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"AzGames WebDriver关闭时出现异常: {str(e)}")
+
     def rotate_user_agent(self):
         """保持固定User-Agent，不再轮换"""
         # 为了保持兼容性，保留此方法但不执行任何操作
@@ -88,16 +220,8 @@ class AzGamesScraper:
         self.cleanup_driver()
 
     def cleanup_driver(self):
-        """清理WebDriver资源"""
-        if self.driver:
-            try:
-                # 尝试关闭所有窗口
-                self.driver.quit()
-                self.logger.info("AzGames WebDriver已正常关闭")
-            except Exception as e:
-                self.logger.warning(f"AzGames WebDriver关闭时出现异常: {str(e)}")
-            finally:
-                self.driver = None
+        """释放对共享WebDriver的引用，浏览器进程留给后续采集复用，进程退出时统一关闭"""
+        self.driver = None
 
     def __del__(self):
         """析构函数，确保资源清理"""
@@ -138,32 +262,42 @@ class AzGamesScraper:
                 if progress_callback:
                     progress_callback(f"根据设置限制，将采集前 {len(game_list)} 个游戏")
 
-            # 第三步：逐个采集游戏详情（不再变化UA，使用固定的搜索引擎UA）
-            for i, (game_name, game_url) in enumerate(game_list, 1):
-                if stop_flag and stop_flag() or self.should_stop:
-                    break
+            # 第三步：并发采集游戏详情（不再变化UA，使用固定的搜索引擎UA），各请求共用session的连接池
+            total = len(game_list)
+            results = {}
+            with ThreadPoolExecutor(max_workers=_DETAIL_WORKERS, thread_name_prefix='azgames') as executor:
+                futures = {
+                    executor.submit(self._scrape_detail_task, i, total, game_name, game_url,
+                                    progress_callback, stop_flag): (i, game_name)
+                    for i, (game_name, game_url) in enumerate(game_list, 1)
+                }
 
-                if progress_callback:
-                    progress_callback(f"正在采集游戏 {i}/{len(game_list)}: {game_name}")
+                for future in as_completed(futures):
+                    if stop_flag and stop_flag() or self.should_stop:
+                        # 取消尚未开始的任务，正在进行的请求结束后退出
+                        for pending in futures:
+                            pending.cancel()
+                        break
 
-                try:
-                    game_data = self.scrape_game_detail(game_url, game_name)
-                    if game_data:
-                        games.append(game_data)
-                        if progress_callback:
-                            progress_callback(f"成功采集游戏: {game_name}", len(games))
-                    else:
-                        if progress_callback:
-                            progress_callback(f"跳过游戏: {game_name} (无有效embed URL)")
+                    i, game_name = futures[future]
+                    try:
+                        game_data = future.result()
+                        if game_data:
+                            results[i] = game_data
+                            if progress_callback:
+                                progress_callback(f"成功采集游戏: {game_name}", len(results))
+                        else:
+                            if progress_callback:
+                                progress_callback(f"跳过游戏: {game_name} (无有效embed URL)")
 
-                    # 适当延时，避免请求过于频繁
-                    self.random_delay(1, 3)
+                    except Exception as e:
+                        self.logger.error(f"采集游戏详情失败 {game_name}: {str(e)}")
+                        if progress_callback:
+                            progress_callback(f"采集失败: {game_name} - {str(e)}")
+                        continue
 
-                except Exception as e:
-                    self.logger.error(f"采集游戏详情失败 {game_name}: {str(e)}")
-                    if progress_callback:
-                        progress_callback(f"采集失败: {game_name} - {str(e)}")
-                    continue
+            # 按游戏列表原有顺序返回
+            games = [results[i] for i in sorted(results)]
 
         except Exception as e:
             self.logger.error(f"采集过程中发生错误: {str(e)}")
@@ -172,6 +306,36 @@ class AzGamesScraper:
 
         return games
 
+    def _scrape_detail_task(self, index, total, game_name, game_url, progress_callback=None, stop_flag=None):
+        """
+        线程池任务：采集单个游戏详情
+
+        Args:
+            index (int): 游戏序号
+            total (int): 游戏总数
+            game_name (str): 游戏名称
+            game_url (str): 游戏页面URL
+            progress_callback: 进度回调函数
+            stop_flag: 停止标志函数
+
+        Returns:
+            dict: 游戏数据字典，已停止或无有效embed URL时返回None
+        """
+        if stop_flag and stop_flag() or self.should_stop:
+            return None
+
+        if progress_callback:
+            progress_callback(f"正在采集游戏 {index}/{total}: {game_name}")
+
+        return self.scrape_game_detail(game_url, game_name)
+
+    def _get_data_manager(self):
+        """获取数据管理器，未注入时创建一个"""
+        if self.data_manager is None:
+            from .data_manager import DataManager
+            self.data_manager = DataManager()
+        return self.data_manager
+
     def get_all_games_list(self, progress_callback=None, stop_flag=None):
         """
         获取所有游戏的基本信息列表（名称和URL），并过滤已存在的游戏
@@ -190,11 +354,8 @@ class AzGamesScraper:
                 progress_callback("正在获取已存在的游戏列表进行去重...")
 
             # 获取已存在的游戏名称（跨平台去重）
-            from .data_manager import DataManager
-            data_manager = DataManager()
-            existing_games = data_manager.load_games()  # 加载所有平台的游戏
-            existing_names = {data_manager.normalize_game_name(game.get('name', ''))
-                            for game in existing_games}
+            data_manager = self._get_data_manager()
+            existing_names = set(data_manager.existing_normalized_names)  # 所有平台已有的游戏
 
             if progress_callback:
                 progress_callback(f"数据库中已有 {len(existing_names)} 个游戏，开始获取AzGames游戏列表...")
@@ -203,10 +364,10 @@ class AzGamesScraper:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, _HTML_PARSER, parse_only=_GRID_STRAINER)
 
-            # 查找游戏链接元素
-            game_links = soup.select('.us-grid-game a.us-game-link')
+            # 查找游戏链接元素（解析结果中只有.us-grid-game部分）
+            game_links = soup.find_all('a', class_='us-game-link')
 
             if progress_callback:
                 progress_callback(f"在页面中找到 {len(game_links)} 个游戏链接，开始过滤重复...")
@@ -228,8 +389,9 @@ class AzGamesScraper:
                     if game_url.startswith('/'):
                         game_url = 'https://azgames.io' + game_url
 
-                    # 避免重复
-                    if game_url in processed_urls:
+                    # 按规范化后的路径去重，忽略大小写、末尾斜杠和查询参数的差异
+                    url_key = urlparse(game_url).path.rstrip('/').lower()
+                    if url_key in processed_urls:
                         continue
 
                     # 从链接内部的img元素获取游戏名称
@@ -255,7 +417,7 @@ class AzGamesScraper:
                             continue
 
                         game_list.append((game_name, game_url))
-                        processed_urls.add(game_url)
+                        processed_urls.add(url_key)
                         existing_names.add(normalized_name)  # 添加到已存在列表，避免本次内部重复
 
                         if progress_callback and len(game_list) % 10 == 0:
@@ -285,6 +447,14 @@ class AzGamesScraper:
         Returns:
             bool: 是否成功加载更多
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+        # 首次翻页时才启动浏览器
+        if not self.driver and not self.init_driver():
+            return False
+
         try:
             # 记录加载前的游戏数量
             initial_games = len(self.driver.find_elements(By.CSS_SELECTOR, ".us-grid-game a.us-game-link"))
@@ -304,8 +474,13 @@ class AzGamesScraper:
                 self.logger.info("未找到More games按钮，尝试直接调用paging函数")
                 self.driver.execute_script(f"paging({page_number})")
 
-            # 等待新内容加载
-            time.sleep(5)
+            # 等待新游戏出现，最多等待10秒
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    lambda d: len(d.find_elements(By.CSS_SELECTOR, ".us-grid-game a.us-game-link")) > initial_games
+                )
+            except TimeoutException:
+                pass
 
             # 检查是否有新游戏加载
             final_games = len(self.driver.find_elements(By.CSS_SELECTOR, ".us-grid-game a.us-game-link"))
@@ -341,30 +516,9 @@ class AzGamesScraper:
             return False
 
         # 过滤掉分类页面和其他非游戏页面
-        invalid_patterns = [
-            '/category/',
-            '/tag/',
-            '/search',
-            '/user/',
-            '/about',
-            '/contact',
-            '/privacy',
-            '/terms',
-            '/#',
-            'javascript:',
-            'mailto:',
-            'tel:',
-            '/upload/',
-            '/static/',
-            '/css/',
-            '/js/',
-            '/images/'
-        ]
-
-        for pattern in invalid_patterns:
-            if pattern in game_url.lower():
-                self.logger.debug(f"过滤掉非游戏链接: {game_url}")
-                return False
+        if _INVALID_URL_RE.search(game_url.lower()):
+            self.logger.debug(f"过滤掉非游戏链接: {game_url}")
+            return False
 
         # 确保是具体的游戏页面（通常是 /game-name 格式）
         if game_url.startswith('https://azgames.io/'):
@@ -395,14 +549,13 @@ class AzGamesScraper:
         try:
             self.logger.info(f"正在处理游戏: {game_name} - {game_url}")
 
-            # 使用requests获取游戏详情页面
-            response = self.session.get(game_url, timeout=30)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # 提取embed URL
-            embed_url = self.extract_embed_url(soup, game_url, response.text)
+            # 缓存中是上次解析出的embed URL，空字符串表示上次没有找到
+            embed_url = self._read_cache(game_url)
+            if embed_url is not None:
+                self.logger.debug(f"使用详情页缓存: {game_url}")
+            else:
+                embed_url = self._fetch_embed_url(game_url)
+                self._write_cache(game_url, embed_url or '')
 
             # 只有当embed_url有效时才返回数据
             if embed_url and embed_url.strip():
@@ -424,6 +577,134 @@ class AzGamesScraper:
             self.logger.error(f"采集游戏详情失败 {game_url}: {str(e)}")
             return None
 
+    def _fetch_embed_url(self, game_url):
+        """
+        请求游戏详情页面并提取embed URL
+
+        Args:
+            game_url (str): 游戏页面URL
+
+        Returns:
+            str: embed URL，未找到时返回None
+        """
+        # 按整体速率限速，等待时间与其他线程的网络请求重叠，而不是每个请求后固定睡眠
+        self.rate_limiter.acquire()
+
+        # 使用requests流式获取游戏详情页面，边读边查找完整的embed URL，几乎所有页面都能提前命中
+        response = self.session.get(game_url, timeout=30, stream=True)
+        try:
+            response.raise_for_status()
+            embed_url, raw = self._stream_embed_url(response)
+        finally:
+            response.close()
+        if embed_url:
+            return embed_url
+
+        # 读完页面仍未找到时，解码一次后构建解析树用完整的提取逻辑
+        html_content = raw.decode(response.encoding or 'utf-8', errors='replace')
+        soup = BeautifulSoup(html_content, _HTML_PARSER)
+        return self.extract_embed_url(soup, game_url, html_content)
+
+    def _stream_embed_url(self, response):
+        """
+        分块读取响应内容，边读边扫描embed URL，匹配后不再读取剩余内容
+
+        Args:
+            response (requests.Response): 以stream=True发出的请求的响应
+
+        Returns:
+            tuple: (embed URL或None, 未找到时已读取的页面字节)
+        """
+        buffer = bytearray()
+        for chunk in response.iter_content(_STREAM_CHUNK_SIZE):
+            # 只扫描新读到的内容，加上回看部分
+            start = max(0, len(buffer) - _STREAM_OVERLAP)
+            buffer += chunk
+
+            match = _EMBED_ABS_BYTES_RE.search(buffer, start)
+            if match:
+                embed_url = match.group(0).decode(response.encoding or 'utf-8', errors='replace')
+                self.logger.info(f"通过HTML扫描找到URL: {embed_url}")
+                return embed_url, b''
+
+            if len(buffer) >= _MAX_PAGE_BYTES:
+                self.logger.warning(f"页面超过 {_MAX_PAGE_BYTES // 1024} KB，停止读取: {response.url}")
+                break
+
+        return None, bytes(buffer)
+
+    def _cache_dir(self):
+        """详情页缓存目录，位于数据管理器的数据目录下"""
+        return os.path.join(self._get_data_manager().data_dir, 'cache', 'azgames')
+
+    def _cache_path(self, game_url):
+        """根据URL的SHA1生成缓存文件路径"""
+        return os.path.join(self._cache_dir(), hashlib.sha1(game_url.encode('utf-8')).hexdigest() + '.txt')
+
+    def _read_cache(self, game_url):
+        """
+        读取未过期的详情页解析结果
+
+        Args:
+            game_url (str): 游戏页面URL
+
+        Returns:
+            str: 缓存的embed URL，上次未找到时为空字符串，无缓存或已过期时返回None
+        """
+        path = self._cache_path(game_url)
+        try:
+            if time.time() - os.path.getmtime(path) > _CACHE_TTL:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_cache(self, game_url, embed_url):
+        """
+        保存详情页解析结果，并定期清理过期缓存，写入失败不影响采集
+
+        Args:
+            game_url (str): 游戏页面URL
+            embed_url (str): 解析出的embed URL，未找到时为空字符串
+        """
+        cache_dir = self._cache_dir()
+        path = self._cache_path(game_url)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # 先写临时文件再替换，避免中断时留下不完整的缓存
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(embed_url)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"写入详情页缓存失败 {game_url}: {str(e)}")
+            return
+
+        now = time.time()
+        if now - self._cache_pruned_at >= _CACHE_PRUNE_INTERVAL:
+            self._cache_pruned_at = now
+            self._prune_cache(cache_dir, now)
+
+    def _prune_cache(self, cache_dir, now):
+        """
+        删除超过有效期的缓存文件
+
+        Args:
+            cache_dir (str): 缓存目录
+            now (float): 当前时间戳
+        """
+        try:
+            with os.scandir(cache_dir) as entries:
+                for entry in entries:
+                    try:
+                        if now - entry.stat().st_mtime > _CACHE_TTL:
+                            os.remove(entry.path)
+                    except OSError:
+                        continue
+        except OSError as e:
+            self.logger.warning(f"清理详情页缓存失败: {str(e)}")
+
     def extract_embed_url(self, soup, game_url, html_content=None):
         """
         从游戏详情页面提取embed URL
@@ -443,8 +724,7 @@ class AzGamesScraper:
             comments = soup.find_all(string=lambda text: isinstance(text, Comment) and 'az-games__embed-link' in text)
             for comment in comments:
                 # 使用正则表达式提取URL
-                embed_pattern = r'https://azgames\.io/[^<>\s"\']+\.embed'
-                matches = re.findall(embed_pattern, str(comment))
+                matches = _EMBED_ABS_RE.findall(str(comment))
                 if matches:
                     embed_url = matches[0]
                     self.logger.info(f"通过HTML注释找到URL: {embed_url}")
@@ -452,11 +732,9 @@ class AzGamesScraper:
 
             # 方法1.1: 如果没有找到Comment类型，尝试在整个HTML源码中查找注释
             search_content = html_content if html_content else str(soup)
-            comment_pattern = r'<!--.*?az-games__embed-link.*?-->'
-            comment_matches = re.findall(comment_pattern, search_content, re.DOTALL)
+            comment_matches = _EMBED_COMMENT_RE.findall(search_content)
             for comment_match in comment_matches:
-                embed_pattern = r'https://azgames\.io/[^<>\s"\']+\.embed'
-                matches = re.findall(embed_pattern, comment_match)
+                matches = _EMBED_ABS_RE.findall(comment_match)
                 if matches:
                     embed_url = matches[0]
                     self.logger.info(f"通过HTML注释源码找到URL: {embed_url}")
@@ -481,8 +759,7 @@ class AzGamesScraper:
             for script in scripts:
                 if script.string:
                     # 查找包含.embed的字符串
-                    embed_pattern = r'["\']([^"\']*\.embed)["\']'
-                    matches = re.findall(embed_pattern, script.string)
+                    matches = _EMBED_JS_RE.findall(script.string)
                     for match in matches:
                         if match.startswith('/'):
                             embed_url = 'https://azgames.io' + match
@@ -494,15 +771,8 @@ class AzGamesScraper:
             # 方法3.1: 在整个HTML内容中搜索.embed URL
             if html_content:
                 # 搜索所有可能的.embed URL模式
-                embed_patterns = [
-                    r'https://azgames\.io/[^<>\s"\']+\.embed',
-                    r'/[^<>\s"\']+\.embed',
-                    r'"([^"]*\.embed)"',
-                    r"'([^']*\.embed)'",
-                ]
-
-                for pattern in embed_patterns:
-                    matches = re.findall(pattern, html_content)
+                for pattern in _EMBED_HTML_RES:
+                    matches = pattern.findall(html_content)
                     for match in matches:
                         if match.startswith('/'):
                             embed_url = 'https://azgames.io' + match
@@ -518,18 +788,12 @@ class AzGamesScraper:
 
             # 方法4: 根据游戏URL推断embed URL
             # 例如: https://azgames.io/subway-moto -> https://azgames.io/subway-moto.embed
+            # embed地址的规则是固定的，不再额外发送HEAD请求验证
             if game_url.startswith('https://azgames.io/'):
                 game_path = game_url.replace('https://azgames.io/', '')
                 embed_url = f"https://azgames.io/{game_path}.embed"
-
-                # 验证这个URL是否存在
-                try:
-                    response = self.session.head(embed_url, timeout=10)
-                    if response.status_code == 200:
-                        self.logger.info(f"通过推断找到URL: {embed_url}")
-                        return embed_url
-                except:
-                    pass
+                self.logger.info(f"通过推断找到URL: {embed_url}")
+                return embed_url
 
             return None
 
@@ -548,84 +812,9 @@ class AzGamesScraper:
         Returns:
             list: 游戏数据列表
         """
-        games = []
-
-        try:
-            if progress_callback:
-                progress_callback("使用requests方案采集AzGames数据...")
-
-            url = "https://azgames.io/new-games"
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # 查找游戏链接元素 - 使用更精确的选择器
-            game_links = soup.select('.us-grid-game a.us-game-link')
-
-            if progress_callback:
-                progress_callback(f"找到 {len(game_links)} 个游戏")
-
-            for i, link in enumerate(game_links):
-                if stop_flag and stop_flag():
-                    break
+        # 与scrape_games共用同一套列表获取和并发详情采集流程
+        return self.scrape_games(progress_callback, stop_flag)
 
-                try:
-                    # 获取游戏链接
-                    game_url = link.get('href')
-                    if not game_url:
-                        continue
-
-                    # 如果是相对路径，拼接主域名
-                    if game_url.startswith('/'):
-                        game_url = 'https://azgames.io' + game_url
-
-                    # 从链接内部的img元素获取游戏名称
-                    img_element = link.find('img')
-                    game_name = None
-
-                    if img_element:
-                        game_name = img_element.get('title') or img_element.get('alt')
-
-                    if not game_name:
-                        # 尝试从游戏标题div获取名称
-                        title_element = link.find('span', class_='text-overflow')
-                        if title_element:
-                            game_name = title_element.get_text(strip=True)
-
-                    # 如果还是没有找到游戏名称，跳过这个链接
-                    if not game_name:
-                        continue
-
-                    if self.is_valid_game_entry(game_name, game_url):
-                        if progress_callback:
-                            progress_callback(f"正在处理游戏 {i+1}/{len(game_links)}: {game_name}")
-
-                        # 获取游戏详情
-                        game_data = self.scrape_game_detail(game_url, game_name)
-                        if game_data:
-                            games.append(game_data)
-
-                            if progress_callback:
-                                progress_callback(f"成功采集游戏: {game_name}", len(games))
-
-                        # 随机延时
-                        self.random_delay(3, 8)
 
-                        # 限制采集数量
-                        max_games = getattr(self, 'test_limit', None) or self.max_games_limit
-                        if max_games and len(games) >= max_games:
-                            if progress_callback:
-                                progress_callback(f"已达到采集数量限制 ({max_games})")
-                            break
-
-                except Exception as e:
-                    self.logger.error(f"处理游戏时出错: {str(e)}")
-                    continue
-
-        except Exception as e:
-            self.logger.error(f"requests采集失败: {str(e)}")
-            if progress_callback:
-                progress_callback(f"采集错误: {str(e)}")
-
-        return games
+# 进程退出时关闭共享的WebDriver，避免残留chrome进程
+atexit.register(AzGamesScraper._quit_driver)
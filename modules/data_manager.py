@@ -11,8 +11,43 @@ import sqlite3
 import logging
 import time
 import re
+import threading
+from collections import defaultdict
+from functools import lru_cache
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator
+
+# 优先使用orjson（C实现，解析和序列化更快），未安装时回退到标准库json
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+# 游戏名称中需要移除的符号和特殊字符
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+
+
+@lru_cache(maxsize=100_000)
+def _normalize_game_name(name):
+    """标准化游戏名称，结果按名称缓存，同一名称在多次采集中只计算一次"""
+    if not name:
+        return ""
+
+    # 转换为小写
+    name = name.lower().strip()
+
+    # 移除常见符号和特殊字符，只保留字母数字
+    return _NON_ALNUM_RE.sub('', name)
 
 
 class DataManager:
@@ -24,6 +59,11 @@ class DataManager:
         self.db_file = os.path.join(data_dir, "games.db")
         self.logger = logging.getLogger(__name__)
 
+        # 多个平台可能同时采集完成，保存时串行写入JSON和数据库
+        self._save_lock = threading.Lock()
+        # 已保存游戏的标准化名称缓存，读写都在_save_lock内进行
+        self._existing_names = None
+
         # 创建数据目录
         os.makedirs(data_dir, exist_ok=True)
 
@@ -35,22 +75,15 @@ class DataManager:
         标准化游戏名称用于去重比较
         处理空格、符号、大小写等问题
         """
-        if not name:
-            return ""
-
-        # 转换为小写
-        name = name.lower().strip()
-
-        # 移除常见符号和特殊字符，只保留字母数字
-        name = re.sub(r'[^a-zA-Z0-9]', '', name)
-
-        return name
+        return _normalize_game_name(name)
         
     def init_database(self):
         """初始化SQLite数据库"""
         try:
             with sqlite3.connect(self.db_file) as conn:
                 cursor = conn.cursor()
+                # WAL模式写入时不阻塞读取，且设置会持久保存在数据库文件中
+                cursor.execute('PRAGMA journal_mode=WAL')
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS games (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -117,10 +150,13 @@ class DataManager:
 
             # 直接保存（采集阶段已经去重）
             if valid_games:
-                # 保存到JSON文件
-                self.save_to_json(valid_games)
-                # 保存到SQLite数据库
-                self.save_to_database(valid_games)
+                with self._save_lock:
+                    # 保存到JSON文件
+                    self.save_to_json(valid_games)
+                    # 保存到SQLite数据库
+                    self.save_to_database(valid_games)
+                    # 已有游戏名称发生变化，下次使用时重新计算
+                    self._existing_names = None
 
             platform_info = f" ({platform})" if platform else ""
             self.logger.info(f"游戏保存完成{platform_info} - 总数: {len(games)}, 有效: {len(valid_games)}")
@@ -146,32 +182,59 @@ class DataManager:
         all_games = existing_games + games
 
         # 保存到文件
-        with open(self.json_file, 'w', encoding='utf-8') as f:
-            json.dump(all_games, f, ensure_ascii=False, indent=2)
+        with open(self.json_file, 'wb') as f:
+            f.write(_json_dumps(all_games))
             
     def save_to_database(self, games: List[Dict]):
-        """保存到SQLite数据库"""
+        """保存到SQLite数据库（整批在一个事务中写入）"""
+        sql = '''
+            INSERT OR REPLACE INTO games (name, url, embed_url, iframe_url, platform, scraped_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        '''
+        scraped_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        rows = [(
+            game.get('name', ''),
+            game.get('url', ''),
+            game.get('embed_url', ''),
+            game.get('iframe_url', ''),
+            game.get('platform', 'itch.io'),
+            game.get('scraped_at', scraped_at)
+        ) for game in games]
+
         with sqlite3.connect(self.db_file) as conn:
+            # WAL模式下NORMAL同步级别已能保证数据库一致性，提交时少一次fsync
+            conn.execute('PRAGMA synchronous=NORMAL')
             cursor = conn.cursor()
-            
-            for game in games:
-                try:
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO games (name, url, embed_url, iframe_url, platform, scraped_at)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (
-                        game.get('name', ''),
-                        game.get('url', ''),
-                        game.get('embed_url', ''),
-                        game.get('iframe_url', ''),
-                        game.get('platform', 'itch.io'),
-                        game.get('scraped_at', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-                    ))
-                except Exception as e:
-                    self.logger.error(f"保存游戏到数据库失败 {game.get('name', '')}: {str(e)}")
-                    
+
+            try:
+                cursor.executemany(sql, rows)
+            except sqlite3.Error as e:
+                # 批量写入失败时回滚，逐条重试以跳过有问题的数据
+                conn.rollback()
+                self.logger.warning(f"批量保存到数据库失败，改为逐条保存: {str(e)}")
+                for game, row in zip(games, rows):
+                    try:
+                        cursor.execute(sql, row)
+                    except Exception as e:
+                        self.logger.error(f"保存游戏到数据库失败 {game.get('name', '')}: {str(e)}")
+
             conn.commit()
             
+    @property
+    def existing_normalized_names(self) -> frozenset:
+        """
+        所有平台已保存游戏的标准化名称，用于采集时跨平台去重
+
+        首次访问时加载一次，之后各采集器共用；保存或清空数据后失效并重新计算。
+        计算和保存结果都在_save_lock内进行，避免与其他平台的保存交错而缓存旧数据
+        """
+        with self._save_lock:
+            if self._existing_names is None:
+                self._existing_names = frozenset(
+                    map(_normalize_game_name, (game.get('name', '') for game in self.load_games()))
+                )
+            return self._existing_names
+
     def load_games(self, platform: str = None) -> List[Dict]:
         """
         加载游戏数据
@@ -205,8 +268,8 @@ class DataManager:
             return []
             
         try:
-            with open(self.json_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.json_file, 'rb') as f:
+                return _json_loads(f.read())
         except Exception as e:
             self.logger.error(f"从JSON文件加载数据失败: {str(e)}")
             return []
@@ -301,6 +364,95 @@ class DataManager:
             self.logger.error(f"获取最近游戏数据失败: {str(e)}")
             return []
 
+    def iter_games(self, platforms: List[str], hours: int = None, batch_size: int = 500) -> Iterator[List[Dict]]:
+        """
+        按平台顺序分批读取游戏数据
+
+        Args:
+            platforms: 平台名称列表，按顺序依次读取
+            hours: 只读取最近多少小时内的数据，None表示全部
+            batch_size: 每批返回的记录数
+
+        Returns:
+            Iterator[List[Dict]]: 每次产出一批游戏数据
+        """
+        threshold = None
+        if hours is not None:
+            from datetime import timedelta
+            threshold = (datetime.now() - timedelta(hours=hours)).strftime('%Y-%m-%d %H:%M:%S')
+
+        conn = None
+        try:
+            conn = sqlite3.connect(self.db_file)
+        except sqlite3.Error as e:
+            self.logger.error(f"打开数据库失败，改为从JSON文件读取: {str(e)}")
+
+        # JSON数据按平台分组，首次需要回退时只加载和解析一次
+        json_games = None
+
+        try:
+            for platform in platforms:
+                found = False
+                db_ok = conn is not None
+
+                if db_ok:
+                    try:
+                        if threshold:
+                            cursor = conn.execute('''
+                                SELECT name, url, embed_url, iframe_url, platform, scraped_at
+                                FROM games
+                                WHERE platform = ? AND scraped_at >= ?
+                                ORDER BY scraped_at DESC
+                            ''', (platform, threshold))
+                        else:
+                            cursor = conn.execute('''
+                                SELECT name, url, embed_url, iframe_url, platform, scraped_at
+                                FROM games
+                                WHERE platform = ?
+                                ORDER BY scraped_at DESC
+                            ''', (platform,))
+
+                        while True:
+                            rows = cursor.fetchmany(batch_size)
+                            if not rows:
+                                break
+                            found = True
+                            yield [{
+                                'name': row[0],
+                                'url': row[1],
+                                'embed_url': row[2],
+                                'iframe_url': row[3],
+                                'platform': row[4],
+                                'scraped_at': row[5]
+                            } for row in rows]
+                    except sqlite3.Error as e:
+                        self.logger.error(f"从数据库读取{platform}数据失败，改为从JSON文件读取: {str(e)}")
+                        db_ok = False
+
+                # 已经产出过数据库中的数据时不再回退，避免重复
+                if found:
+                    continue
+                # 与load_games一致：数据库读取失败，或数据库中没有该平台的全量数据时，从JSON文件加载
+                if db_ok and threshold is not None:
+                    continue
+
+                if json_games is None:
+                    json_games = defaultdict(list)
+                    for game in self.load_from_json():
+                        json_games[game.get('platform')].append(game)
+
+                games = json_games.get(platform, [])
+                if threshold:
+                    games = [game for game in games if game.get('scraped_at', '') >= threshold]
+                for i in range(0, len(games), batch_size):
+                    yield games[i:i + batch_size]
+
+        except Exception as e:
+            self.logger.error(f"分批读取游戏数据失败: {str(e)}")
+        finally:
+            if conn is not None:
+                conn.close()
+
     def export_games(self, platform: str = None, format='json', recent_only: bool = False) -> Optional[str]:
         """
         导出游戏数据
@@ -332,8 +484,8 @@ class DataManager:
             filename = f"games_export{platform_suffix}{type_suffix}_{timestamp}.json"
             filepath = os.path.join(self.data_dir, filename)
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(games, f, ensure_ascii=False, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(_json_dumps(games))
 
         elif format == 'csv':
             import csv
@@ -391,6 +543,8 @@ class DataManager:
                 cursor.execute('DELETE FROM games')
                 conn.commit()
                 
+            with self._save_lock:
+                self._existing_names = None
             self.logger.info("数据已清空")
             
         except Exception as e:
@@ -6,29 +6,24 @@ import time
 import random
 import re
 import logging
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 import requests
 from bs4 import BeautifulSoup
 
 
 class GeoGuessrScraper:
-    def __init__(self, max_games_limit=50):
+    def __init__(self, max_games_limit=50, http_adapter=None, data_manager=None):
         """
         初始化GeoGuessr采集器
         
         Args:
             max_games_limit (int): 最大采集游戏数量限制
+            http_adapter (HTTPAdapter): 共享的连接池适配器，多个采集器复用同一组连接
+            data_manager (DataManager): 共享的数据管理器，跨平台去重时复用已加载的游戏名称，未传入时首次采集时创建
         """
         self.max_games_limit = max_games_limit
         self.should_stop = False
         self.driver = None
+        self.data_manager = data_manager
         self.logger = logging.getLogger(__name__)
         
         # 使用固定的User-Agent
@@ -44,10 +39,19 @@ class GeoGuessrScraper:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
+        if http_adapter:
+            self.session.mount('https://', http_adapter)
+            self.session.mount('http://', http_adapter)
 
     def init_driver(self):
         """初始化Chrome WebDriver"""
         try:
+            # Selenium依赖较重，仅在需要浏览器时导入
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            from selenium.webdriver.chrome.service import Service
+            from webdriver_manager.chrome import ChromeDriverManager
+
             chrome_options = Options()
             chrome_options.add_argument('--headless')
             chrome_options.add_argument('--no-sandbox')
@@ -166,6 +170,13 @@ class GeoGuessrScraper:
 
         return games
 
+    def _get_data_manager(self):
+        """获取数据管理器，未注入时创建一个"""
+        if self.data_manager is None:
+            from .data_manager import DataManager
+            self.data_manager = DataManager()
+        return self.data_manager
+
     def get_all_games_list(self, progress_callback=None, stop_flag=None):
         """
         获取所有游戏的基本信息列表（名称和URL），并过滤已存在的游戏
@@ -184,11 +195,8 @@ class GeoGuessrScraper:
                 progress_callback("正在获取已存在的游戏列表进行去重...")
 
             # 获取已存在的游戏名称（跨平台去重）
-            from .data_manager import DataManager
-            data_manager = DataManager()
-            existing_games = data_manager.load_games()  # 加载所有平台的游戏
-            existing_names = {data_manager.normalize_game_name(game.get('name', ''))
-                            for game in existing_games}
+            data_manager = self._get_data_manager()
+            existing_names = set(data_manager.existing_normalized_names)  # 所有平台已有的游戏
 
             if progress_callback:
                 progress_callback(f"数据库中已有 {len(existing_names)} 个游戏，开始获取GeoGuessr游戏列表...")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+请求限速模块
+多个采集线程共享的令牌桶限速器和自适应并发控制器
+"""
+
+import time
+import threading
+from collections import deque
+
+
+class TokenBucket:
+    """令牌桶限速器，线程安全"""
+
+    def __init__(self, capacity=5, rate=3.0):
+        """
+        初始化令牌桶
+
+        Args:
+            capacity (int): 桶容量，即允许的最大突发请求数
+            rate (float): 每秒补充的令牌数，即长期平均请求速率
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        获取一个令牌，令牌不足时阻塞到轮到当前请求为止
+
+        令牌数允许为负，表示已预约的请求；每个线程在锁外等待，互不阻塞
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            wait = max(-self.tokens / self.rate, self._paused_until - now)
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """
+        暂停发放令牌（服务器返回Retry-After时调用）
+
+        Args:
+            seconds (float): 暂停秒数
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD并发控制器，线程安全
+
+    响应正常时并发数线性增加，被限流、出错或平均延迟超过目标时并发数减半。
+    以上下文管理器方式包裹每个请求，超过当前并发数的线程会等待
+    """
+
+    def __init__(self, initial=4, maximum=8, target_latency=2.0, window=10):
+        """
+        初始化并发控制器
+
+        Args:
+            initial (int): 初始并发数
+            maximum (int): 最大并发数
+            target_latency (float): 目标平均响应时间（秒）
+            window (int): 计算平均响应时间的滑动窗口大小
+        """
+        self.limit = float(initial)
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self._latencies = deque(maxlen=window)
+        self._active = 0
+        self._cond = threading.Condition()
+
+    def __enter__(self):
+        with self._cond:
+            while self._active >= int(self.limit):
+                self._cond.wait()
+            self._active += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+        return False
+
+    def record(self, latency, throttled=False):
+        """
+        记录一次请求结果并调整并发数
+
+        Args:
+            latency (float): 本次请求耗时（秒）
+            throttled (bool): 是否被限流或服务器出错
+        """
+        with self._cond:
+            self._latencies.append(latency)
+            average = sum(self._latencies) / len(self._latencies)
+
+            if throttled or average > self.target_latency:
+                # 乘性减少；清空窗口，避免同一批慢请求连续触发减半
+                self.limit = max(1.0, self.limit * 0.5)
+                self._latencies.clear()
+            else:
+                # 加性增加
+                self.limit = min(float(self.maximum), self.limit + 0.5)
+
+            self._cond.notify_all()